@@ -1,4 +1,5 @@
 import contextlib
+from functools import lru_cache
 import locale
 import os
 from typing import Any, Dict, List, Optional
@@ -149,8 +150,9 @@ class ConfigLoader:
             raise ValueError(f"Error in parsing config.yml: {yaml_error}") from yaml_error
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_data_config() -> Dict[str, Any]:
-        """Gets just the YAML data_settings portion of the config"""
+        """Gets just the YAML data_settings portion of the config (parsed once per process, treat it as read-only)"""
         whole_config = ConfigLoader._load_the_config()
 
         data_settings_config: Dict[str, Any] = whole_config.get("data_settings", {})
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -11,18 +10,22 @@ class AttemptStatusesDAO:
         self.db = get_database()
         self.logger = get_logger(__name__)
 
+        self.db.prepare_statement(
+            "attempt_statuses_by_name",
+            "SELECT id, attempt_status_name, updated_at, created_at FROM attempt_statuses WHERE attempt_status_name = $1",
+        )
+
     def create_attempt_status(self, attempt_status_name: str) -> Optional[int]:
         """Create a new attempt status"""
 
         query = """
-            INSERT INTO attempt_statuses (attempt_status_name, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO attempt_statuses (attempt_status_name)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (attempt_status_name, current_timestamp, current_timestamp)
+            params = (attempt_status_name,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
@@ -58,12 +61,8 @@ class AttemptStatusesDAO:
     ) -> Optional[AttemptStatuses]:
         """Gets attempt status by name"""
 
-        query = """
-            SELECT * FROM attempt_statuses WHERE attempt_status_name = %s
-        """
-
         try:
-            results = self.db.execute_select_query(query, (attempt_status_name,))
+            results = self.db.execute_prepared_select_query("attempt_statuses_by_name", (attempt_status_name,))
             if results:
                 return AttemptStatuses.from_dict(results[0])
             return None
@@ -97,11 +96,11 @@ class AttemptStatusesDAO:
         """Update attempt status name"""
 
         query = """
-            UPDATE attempt_statuses SET attempt_status_name = %s, updated_at = %s WHERE id = %s
+            UPDATE attempt_statuses SET attempt_status_name = %s, updated_at = NOW() WHERE id = %s
         """
 
         try:
-            params = (new_name, datetime.now(), status_id)
+            params = (new_name, status_id)
             affected_rows = self.db.execute_update_delete_query(query, params)
 
             if affected_rows > 0:
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from epochai.common.database.database import get_database
 from epochai.common.database.models import CheckCollectionTargets
+from epochai.common.enums import TestStatusNames
 from epochai.common.logging_config import get_logger
 
 
@@ -26,25 +27,25 @@ class CheckCollectionTargetsDAO:
 
         query = """
             INSERT INTO check_collection_targets
-            (collection_target_id, search_term_used, language_code, test_status,
-             search_results_found, error_message, test_duration, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            (collection_target_id, search_term_used, language_code, test_status_id,
+             search_results_found, error_message, test_duration)
+            SELECT %s, %s, %s, id, %s, %s, %s
+            FROM test_statuses
+            WHERE test_status_name = %s
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
             search_results_json = json.dumps(search_results_found)
 
             params = (
                 collection_target_id,
                 search_term_used,
                 language_code,
-                test_status,
                 search_results_json,
                 error_message,
                 test_duration,
-                current_timestamp,
+                test_status,
             )
 
             result = self.db.execute_insert_query(query, params)
@@ -68,12 +69,16 @@ class CheckCollectionTargetsDAO:
         """Gets debug results by test status"""
 
         query = """
-            SELECT * FROM check_collection_targets WHERE test_status = %s ORDER BY created_at DESC
+            SELECT cct.*, ts.test_status_name AS test_status
+            FROM check_collection_targets cct
+            JOIN test_statuses ts ON ts.id = cct.test_status_id
+            WHERE ts.test_status_name = %s
+            ORDER BY cct.created_at DESC
         """
 
         try:
             results = self.db.execute_select_query(query, (test_status,))
-            debug_results = [CheckCollectionTargets.from_dict(row) for row in results]
+            debug_results = CheckCollectionTargets.from_dicts(results)
 
             self.logger.info(f"Found {len(debug_results)} debug results with status '{test_status}'")
             return debug_results
@@ -84,11 +89,11 @@ class CheckCollectionTargetsDAO:
 
     def get_failed_tests(self) -> List[CheckCollectionTargets]:
         """Gets all failed debug tests"""
-        return self.get_by_test_status("failed")
+        return self.get_by_test_status(TestStatusNames.FAILED.value)
 
     def get_successful_tests(self) -> List[CheckCollectionTargets]:
         """Gets all successful debug tests"""
-        return self.get_by_test_status("success")
+        return self.get_by_test_status(TestStatusNames.SUCCESS.value)
 
     def get_by_target_id(
         self,
@@ -97,12 +102,16 @@ class CheckCollectionTargetsDAO:
         """Gets all debug results for a specific target"""
 
         query = """
-            SELECT * FROM check_collection_targets WHERE collection_target_id = %s ORDER BY created_at DESC
+            SELECT cct.*, ts.test_status_name AS test_status
+            FROM check_collection_targets cct
+            JOIN test_statuses ts ON ts.id = cct.test_status_id
+            WHERE cct.collection_target_id = %s
+            ORDER BY cct.created_at DESC
         """
 
         try:
             results = self.db.execute_select_query(query, (collection_target_id,))
-            return [CheckCollectionTargets.from_dict(row) for row in results]
+            return CheckCollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -115,24 +124,26 @@ class CheckCollectionTargetsDAO:
 
         stats_query = """
             SELECT
-                test_status,
+                ts.test_status_name AS test_status,
                 COUNT(*) as test_count,
-                AVG(test_duration) as avg_duration,
-                MIN(test_duration) as min_duration,
-                MAX(test_duration) as max_duration
-            FROM check_collection_targets
-            GROUP BY test_status
+                AVG(cct.test_duration) as avg_duration,
+                MIN(cct.test_duration) as min_duration,
+                MAX(cct.test_duration) as max_duration
+            FROM check_collection_targets cct
+            JOIN test_statuses ts ON ts.id = cct.test_status_id
+            GROUP BY ts.test_status_name
             ORDER BY test_count DESC
         """
 
         language_stats_query = """
             SELECT
-                language_code,
+                cct.language_code,
                 COUNT(*) as test_count,
-                COUNT(CASE WHEN test_status = 'success' THEN 1 END) as success_count,
-                COUNT(CASE WHEN test_status = 'failed' THEN 1 END) as failed_count
-            FROM check_collection_targets
-            GROUP BY language_code
+                COUNT(CASE WHEN ts.test_status_name = 'success' THEN 1 END) as success_count,
+                COUNT(CASE WHEN ts.test_status_name = 'failed' THEN 1 END) as failed_count
+            FROM check_collection_targets cct
+            JOIN test_statuses ts ON ts.id = cct.test_status_id
+            GROUP BY cct.language_code
             ORDER BY test_count DESC
         """
 
@@ -174,15 +185,17 @@ class CheckCollectionTargetsDAO:
         """Gets debug tests from the last X hours"""
 
         query = """
-            SELECT * FROM check_collection_targets
-            WHERE created_at >= %s
-            ORDER BY created_at DESC
+            SELECT cct.*, ts.test_status_name AS test_status
+            FROM check_collection_targets cct
+            JOIN test_statuses ts ON ts.id = cct.test_status_id
+            WHERE cct.created_at >= %s
+            ORDER BY cct.created_at DESC
         """
 
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
             results = self.db.execute_select_query(query, (cutoff_time,))
-            return [CheckCollectionTargets.from_dict(row) for row in results]
+            return CheckCollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting recent debug tests from last {hours} hours: {general_error}")
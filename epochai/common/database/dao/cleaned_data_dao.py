@@ -1,6 +1,6 @@
 from datetime import datetime
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from epochai.common.database.database import get_database
 from epochai.common.database.models import CleanedData
@@ -12,6 +12,40 @@ class CleanedDataDAO:
         self.db = get_database()
         self.logger = get_logger(__name__)
 
+        # Run once per cleaned item, so it is planned once per connection rather than on every insert.
+        # Already cleaned rows hit the unique key and return nothing instead of being checked for up front.
+        # The cleaner is only inserted when missing. A concurrent insert of the same new cleaner is not visible to
+        # this statement's snapshot, so the conflict does a no-op update to still return its id
+        self.db.prepare_statement(
+            "cleaned_data_insert",
+            """
+            WITH existing_cleaner AS (
+                SELECT id FROM cleaners WHERE cleaner_name = $1 AND cleaner_version = $2
+            ),
+            new_cleaner AS (
+                INSERT INTO cleaners (cleaner_name, cleaner_version)
+                SELECT $1, $2
+                WHERE NOT EXISTS (SELECT 1 FROM existing_cleaner)
+                ON CONFLICT (cleaner_name, cleaner_version) DO UPDATE SET cleaner_name = EXCLUDED.cleaner_name
+                RETURNING id
+            ),
+            cleaner AS (
+                SELECT id FROM existing_cleaner
+                UNION ALL
+                SELECT id FROM new_cleaner
+            )
+            INSERT INTO cleaned_data
+            (raw_data_id, cleaned_data_metadata_schema_id, title, language_code,
+             url, metadata, validation_status_id, validation_error, cleaner_id,
+             cleaning_time_ms, cleaned_at)
+            SELECT $3, $4, $5, $6, $7, $8, $9, $10, cleaner.id, $11, COALESCE($12, NOW())
+            FROM cleaner
+            LIMIT 1
+            ON CONFLICT (raw_data_id, cleaner_id) DO NOTHING
+            RETURNING id
+            """,
+        )
+
     def check_if_already_cleaned_for_version(
         self,
         raw_data_id: int,
@@ -21,10 +55,12 @@ class CleanedDataDAO:
         """Checks if raw data was already cleaned for a specific version of a specific cleaner"""
 
         query = """
-            SELECT * FROM cleaned_data
-            WHERE raw_data_id = %s
-            AND cleaner_used = %s
-            AND cleaner_version = %s
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            WHERE cd.raw_data_id = %s
+            AND c.cleaner_name = %s
+            AND c.cleaner_version = %s
             LIMIT 1
         """
 
@@ -61,29 +97,13 @@ class CleanedDataDAO:
             The id of created cleaned data or None if it fails
         """
 
-        query = """
-            INSERT INTO cleaned_data
-            (raw_data_id, cleaned_data_metadata_schema_id, title, language_code,
-             url, metadata, validation_status_id, validation_error, cleaner_used,
-             cleaner_version, cleaning_time_ms, cleaned_at, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """
-
         try:
-            existing = self.check_if_already_cleaned_for_version(raw_data_id, cleaner_used, cleaner_version)
-            if existing:
-                self.logger.warning(
-                    f"Raw data id {raw_data_id} already cleaned by {cleaner_used} v{cleaner_version} (existing cleaned data id: {existing.id})",  # noqa
-                )
-                return existing.id
-
-            current_timestamp = datetime.now()
-            cleaned_at_timestamp = cleaned_at if cleaned_at else current_timestamp
             validation_error_json = json.dumps(validation_error) if validation_error else None
             metadata_json = json.dumps(metadata) if metadata else None
 
             params = (
+                cleaner_used,
+                cleaner_version,
                 raw_data_id,
                 cleaned_data_metadata_schema_id,
                 title,
@@ -92,20 +112,22 @@ class CleanedDataDAO:
                 metadata_json,
                 validation_status_id,
                 validation_error_json,
-                cleaner_used,
-                cleaner_version,
                 cleaning_time_ms,
-                cleaned_at_timestamp,
-                current_timestamp,
+                cleaned_at,
             )
 
-            result = self.db.execute_insert_query(query, params)
+            result = self.db.execute_prepared_insert_query("cleaned_data_insert", params)
 
             if result:
-                self.logger.info(
-                    f"Created cleaned data: '{title}' (raw_data_id: {raw_data_id})",
-                )
+                self.logger.info("Created cleaned data: '%s' (raw_data_id: %s)", title, raw_data_id)
                 return result
+
+            existing = self.check_if_already_cleaned_for_version(raw_data_id, cleaner_used, cleaner_version)
+            if existing:
+                self.logger.warning(
+                    f"Raw data id {raw_data_id} already cleaned by {cleaner_used} v{cleaner_version} (existing cleaned data id: {existing.id})",  # noqa
+                )
+                return existing.id
             self.logger.error(f"Failed to create cleaned data: '{title}'")
             return None
 
@@ -120,7 +142,10 @@ class CleanedDataDAO:
         """Gets cleaned data by id"""
 
         query = """
-            SELECT * FROM cleaned_data WHERE id = %s
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            WHERE cd.id = %s
         """
 
         try:
@@ -139,20 +164,32 @@ class CleanedDataDAO:
     ) -> List[CleanedData]:
         """Gets all cleaned data with an optional limit"""
 
+        try:
+            return list(self.iter_all(limit))
+
+        except Exception as general_error:
+            self.logger.error(f"Error getting all cleaned data: {general_error}")
+            return []
+
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        itersize: int = 1000,
+    ) -> Iterator[CleanedData]:
+        """Streams all cleaned data through a server-side cursor without loading the whole table, errors propagate"""
+
         query = """
-            SELECT * FROM cleaned_data ORDER BY created_at DESC
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            ORDER BY cd.created_at DESC
         """
 
         if limit:
             query += f" LIMIT {limit}"
 
-        try:
-            results = self.db.execute_select_query(query)
-            return [CleanedData.from_dict(row) for row in results]
-
-        except Exception as general_error:
-            self.logger.error(f"Error getting all cleaned data: {general_error}")
-            return []
+        for row in self.db.iter_select_query(query, itersize=itersize):
+            yield CleanedData.from_dict(row)
 
     def get_by_raw_data_id(
         self,
@@ -161,12 +198,16 @@ class CleanedDataDAO:
         """Gets all cleaned data for a specific raw data record"""
 
         query = """
-            SELECT * FROM cleaned_data WHERE raw_data_id = %s ORDER BY created_at DESC
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            WHERE cd.raw_data_id = %s
+            ORDER BY cd.created_at DESC
         """
 
         try:
             results = self.db.execute_select_query(query, (raw_data_id,))
-            return [CleanedData.from_dict(row) for row in results]
+            return CleanedData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting cleaned data for raw_data_id {raw_data_id}: {general_error}")
@@ -179,8 +220,9 @@ class CleanedDataDAO:
         """Gets cleaned data by validation status"""
 
         query = """
-            SELECT cd.*
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
             FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
             JOIN validation_statuses vs ON cd.validation_status_id = vs.id
             WHERE vs.validation_status_name = %s
             ORDER BY cd.created_at DESC
@@ -188,7 +230,7 @@ class CleanedDataDAO:
 
         try:
             results = self.db.execute_select_query(query, (validation_status_name,))
-            cleaned_data = [CleanedData.from_dict(row) for row in results]
+            cleaned_data = CleanedData.from_dicts(results)
 
             self.logger.info(
                 f"Found {len(cleaned_data)} cleaned data with validation status '{validation_status_name}'",
@@ -222,22 +264,26 @@ class CleanedDataDAO:
 
         if cleaner_version:
             query = """
-                SELECT * FROM cleaned_data
-                WHERE cleaner_used = %s AND cleaner_version = %s
-                ORDER BY created_at DESC
+                SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+                FROM cleaned_data cd
+                JOIN cleaners c ON c.id = cd.cleaner_id
+                WHERE c.cleaner_name = %s AND c.cleaner_version = %s
+                ORDER BY cd.created_at DESC
             """
             params = (cleaner_used, cleaner_version)
         else:
             query = """
-                SELECT * FROM cleaned_data
-                WHERE cleaner_used = %s
-                ORDER BY created_at DESC
+                SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+                FROM cleaned_data cd
+                JOIN cleaners c ON c.id = cd.cleaner_id
+                WHERE c.cleaner_name = %s
+                ORDER BY cd.created_at DESC
             """
             params = (cleaner_used,)  # type: ignore
 
         try:
             results = self.db.execute_select_query(query, params)
-            return [CleanedData.from_dict(row) for row in results]
+            return CleanedData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting cleaned data by cleaner '{cleaner_used}': {general_error}")
@@ -313,13 +359,17 @@ class CleanedDataDAO:
         """Search cleaned data by title (partial match)"""
 
         query = """
-            SELECT * FROM cleaned_data WHERE title ILIKE %s ORDER BY created_at DESC
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            WHERE cd.title ILIKE %s
+            ORDER BY cd.created_at DESC
         """
 
         try:
             search_pattern = f"%{search_term}%"
             results = self.db.execute_select_query(query, (search_pattern,))
-            return [CleanedData.from_dict(row) for row in results]
+            return CleanedData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error searching cleaned data by title '{search_term}': {general_error}")
@@ -334,22 +384,26 @@ class CleanedDataDAO:
 
         if metadata_field:
             query = """
-                SELECT * FROM cleaned_data
-                WHERE metadata ->> %s ILIKE %s
-                ORDER BY created_at DESC
+                SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+                FROM cleaned_data cd
+                JOIN cleaners c ON c.id = cd.cleaner_id
+                WHERE cd.metadata ->> %s ILIKE %s
+                ORDER BY cd.created_at DESC
             """
             params = (metadata_field, f"%{search_term}%")
         else:
             query = """
-                SELECT * FROM cleaned_data
-                WHERE metadata::text ILIKE %s
-                ORDER BY created_at DESC
+                SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+                FROM cleaned_data cd
+                JOIN cleaners c ON c.id = cd.cleaner_id
+                WHERE cd.metadata::text ILIKE %s
+                ORDER BY cd.created_at DESC
             """
             params = (f"%{search_term}%",)  # type: ignore
 
         try:
             results = self.db.execute_select_query(query, params)
-            return [CleanedData.from_dict(row) for row in results]
+            return CleanedData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -368,6 +422,8 @@ class CleanedDataDAO:
         query = """
             SELECT
                 cd.*,
+                c.cleaner_name AS cleaner_used,
+                c.cleaner_version,
                 vs.validation_status_name,
                 rd.title as raw_data_title,
                 rd.url as raw_data_url,
@@ -376,6 +432,7 @@ class CleanedDataDAO:
                 cfg.collection_name,
                 ct.collection_type
             FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
             LEFT JOIN validation_statuses vs ON cd.validation_status_id = vs.id
             LEFT JOIN raw_data rd ON cd.raw_data_id = rd.id
             LEFT JOIN collection_attempts ca ON rd.collection_attempt_id = ca.id
@@ -403,7 +460,7 @@ class CleanedDataDAO:
             SELECT
                 COUNT(*) as total_records,
                 COUNT(DISTINCT raw_data_id) as unique_raw_data,
-                COUNT(DISTINCT cleaner_used) as unique_cleaners,
+                COUNT(DISTINCT cleaner_id) as unique_cleaners,
                 COUNT(DISTINCT language_code) as unique_languages,
                 AVG(cleaning_time_ms) as avg_cleaning_time_ms,
                 MIN(cleaning_time_ms) as min_cleaning_time_ms,
@@ -423,12 +480,13 @@ class CleanedDataDAO:
 
         cleaner_stats_query = """
             SELECT
-                cleaner_used,
-                cleaner_version,
+                c.cleaner_name AS cleaner_used,
+                c.cleaner_version,
                 COUNT(*) as record_count,
-                AVG(cleaning_time_ms) as avg_cleaning_time_ms
-            FROM cleaned_data
-            GROUP BY cleaner_used, cleaner_version
+                AVG(cd.cleaning_time_ms) as avg_cleaning_time_ms
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            GROUP BY c.cleaner_name, c.cleaner_version
             ORDER BY record_count DESC
         """
 
@@ -472,9 +530,11 @@ class CleanedDataDAO:
         """Gets cleaned data created in the last X hours"""
 
         query = """
-            SELECT * FROM cleaned_data
-            WHERE created_at >= %s
-            ORDER BY created_at DESC
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            WHERE cd.created_at >= %s
+            ORDER BY cd.created_at DESC
         """
 
         try:
@@ -482,7 +542,7 @@ class CleanedDataDAO:
 
             cutoff_time = datetime.now() - timedelta(hours=hours)
             results = self.db.execute_select_query(query, (cutoff_time,))
-            return [CleanedData.from_dict(row) for row in results]
+            return CleanedData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting recent cleaned data from last {hours} hours: {general_error}")
@@ -495,14 +555,16 @@ class CleanedDataDAO:
         """Gets all cleaned data using a specific metadata schema"""
 
         query = """
-            SELECT * FROM cleaned_data
-            WHERE cleaned_data_metadata_schema_id = %s
-            ORDER BY created_at DESC
+            SELECT cd.*, c.cleaner_name AS cleaner_used, c.cleaner_version
+            FROM cleaned_data cd
+            JOIN cleaners c ON c.id = cd.cleaner_id
+            WHERE cd.cleaned_data_metadata_schema_id = %s
+            ORDER BY cd.created_at DESC
         """
 
         try:
             results = self.db.execute_select_query(query, (schema_id,))
-            return [CleanedData.from_dict(row) for row in results]
+            return CleanedData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting cleaned data by schema id {schema_id}: {general_error}")
@@ -624,31 +686,33 @@ class CleanedDataDAO:
         if cleaner_used:
             query = """
                 SELECT
-                    cleaner_used,
-                    cleaner_version,
+                    c.cleaner_name AS cleaner_used,
+                    c.cleaner_version,
                     COUNT(*) as total_cleaned,
-                    AVG(cleaning_time_ms) as avg_time_ms,
-                    MIN(cleaning_time_ms) as min_time_ms,
-                    MAX(cleaning_time_ms) as max_time_ms,
-                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY cleaning_time_ms) as median_time_ms
-                FROM cleaned_data
-                WHERE cleaner_used = %s
-                GROUP BY cleaner_used, cleaner_version
+                    AVG(cd.cleaning_time_ms) as avg_time_ms,
+                    MIN(cd.cleaning_time_ms) as min_time_ms,
+                    MAX(cd.cleaning_time_ms) as max_time_ms,
+                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY cd.cleaning_time_ms) as median_time_ms
+                FROM cleaned_data cd
+                JOIN cleaners c ON c.id = cd.cleaner_id
+                WHERE c.cleaner_name = %s
+                GROUP BY c.cleaner_name, c.cleaner_version
                 ORDER BY total_cleaned DESC
             """
             params = (cleaner_used,)
         else:
             query = """
                 SELECT
-                    cleaner_used,
-                    cleaner_version,
+                    c.cleaner_name AS cleaner_used,
+                    c.cleaner_version,
                     COUNT(*) as total_cleaned,
-                    AVG(cleaning_time_ms) as avg_time_ms,
-                    MIN(cleaning_time_ms) as min_time_ms,
-                    MAX(cleaning_time_ms) as max_time_ms,
-                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY cleaning_time_ms) as median_time_ms
-                FROM cleaned_data
-                GROUP BY cleaner_used, cleaner_version
+                    AVG(cd.cleaning_time_ms) as avg_time_ms,
+                    MIN(cd.cleaning_time_ms) as min_time_ms,
+                    MAX(cd.cleaning_time_ms) as max_time_ms,
+                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY cd.cleaning_time_ms) as median_time_ms
+                FROM cleaned_data cd
+                JOIN cleaners c ON c.id = cd.cleaner_id
+                GROUP BY c.cleaner_name, c.cleaner_version
                 ORDER BY total_cleaned DESC
             """
             params = ()  # type: ignore
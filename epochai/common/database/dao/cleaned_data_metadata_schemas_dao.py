@@ -1,6 +1,6 @@
 from datetime import datetime
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from epochai.common.database.database import get_database
 from epochai.common.database.models import CleanedDataMetadataSchemas
@@ -16,24 +16,24 @@ class CleanedDataMetadataSchemasDAO:
         self,
         metadata_schema: Dict[str, Any],
     ) -> Optional[int]:
-        """Creates a new cleaned data metadata schema"""
+        """Creates a new cleaned data metadata schema, returns None if an identical schema already exists"""
 
         query = """
-            INSERT INTO cleaned_data_metadata_schemas (metadata_schema, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO cleaned_data_metadata_schemas (metadata_schema)
+            VALUES (%s)
+            ON CONFLICT (content_hash) DO NOTHING
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
             schema_json = json.dumps(metadata_schema)
-            params = (schema_json, current_timestamp, current_timestamp)
+            params = (schema_json,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
                 self.logger.info(f"Created cleaned data metadata schema with ID: {result}")
                 return result
-            self.logger.error("Failed to create cleaned data metadata schema")
+            self.logger.warning("Cleaned data metadata schema not created, an identical schema already exists")
             return None
 
         except Exception as general_error:
@@ -77,6 +77,58 @@ class CleanedDataMetadataSchemasDAO:
             self.logger.error(f"Error getting all cleaned data metadata schemas: {general_error}")
             return []
 
+    def get_by_name_and_version(
+        self,
+        name_field: str,
+        name: str,
+        version_field: str,
+        version: str,
+    ) -> Optional[CleanedDataMetadataSchemas]:
+        """Gets the newest cleaned data metadata schema whose name and version fields match"""
+
+        query = """
+            SELECT * FROM cleaned_data_metadata_schemas
+            WHERE metadata_schema @> %s::jsonb
+            ORDER BY created_at DESC
+            LIMIT 1
+        """
+
+        try:
+            containment = json.dumps({name_field: name, version_field: version})
+            results = self.db.execute_select_query(query, (containment,))
+            if results:
+                return CleanedDataMetadataSchemas.from_dict(results[0])
+            return None
+
+        except Exception as general_error:
+            self.logger.error(f"Error getting cleaned data metadata schema for '{name}' v{version}: {general_error}")
+            return None
+
+    def get_id_and_updated_at_by_name_and_version(
+        self,
+        name_field: str,
+        name: str,
+        version_field: str,
+        version: str,
+    ) -> Optional[Tuple[int, datetime]]:
+        """Gets only the id and updated_at of the newest cleaned data metadata schema with the given name and version"""
+
+        query = """
+            SELECT id, updated_at FROM cleaned_data_metadata_schemas
+            WHERE metadata_schema @> %s::jsonb
+            ORDER BY created_at DESC
+            LIMIT 1
+        """
+
+        try:
+            containment = json.dumps({name_field: name, version_field: version})
+            results = self.db.execute_select_query_tuples(query, (containment,))
+            return results[0] if results else None
+
+        except Exception as general_error:
+            self.logger.error(f"Error getting cleaned data metadata schema id for '{name}' v{version}: {general_error}")
+            return None
+
     def update_schema(
         self,
         schema_id: int,
@@ -86,13 +138,13 @@ class CleanedDataMetadataSchemasDAO:
 
         query = """
             UPDATE cleaned_data_metadata_schemas
-            SET metadata_schema = %s, updated_at = %s
+            SET metadata_schema = %s, updated_at = NOW()
             WHERE id = %s
         """
 
         try:
             schema_json = json.dumps(metadata_schema)
-            params = (schema_json, datetime.now(), schema_id)
+            params = (schema_json, schema_id)
             affected_rows = self.db.execute_update_delete_query(query, params)
 
             if affected_rows > 0:
@@ -135,12 +187,14 @@ class CleanedDataMetadataSchemasDAO:
         """Finds a schema that matches the given content structure"""
 
         query = """
-            SELECT * FROM cleaned_data_metadata_schemas WHERE metadata_schema = %s
+            SELECT * FROM cleaned_data_metadata_schemas
+            WHERE content_hash = md5(%s::jsonb::text)
+            AND metadata_schema = %s::jsonb
         """
 
         try:
-            schema_json = json.dumps(schema_content, sort_keys=True)
-            results = self.db.execute_select_query(query, (schema_json,))
+            schema_json = json.dumps(schema_content)
+            results = self.db.execute_select_query(query, (schema_json, schema_json))
             if results:
                 return CleanedDataMetadataSchemas.from_dict(results[0])
             return None
@@ -161,7 +215,9 @@ class CleanedDataMetadataSchemasDAO:
         new_id = self.create_schema(metadata_schema)
         if new_id:
             return self.get_by_id(new_id)
-        return None
+
+        # Another writer inserted the same schema between the lookup and the insert
+        return self.find_schema_by_content(metadata_schema)
 
     def get_unused_schemas(self) -> List[CleanedDataMetadataSchemas]:
         """Gets schemas that are not being used by any cleaned data"""
@@ -5,6 +5,12 @@ from epochai.common.database.database import get_database
 from epochai.common.database.models import CollectionAttempts
 from epochai.common.logging_config import get_logger
 
+# CollectionAttempts fields in order, bulk reads select these as tuples for CollectionAttempts.from_rows
+ATTEMPT_COLUMNS = (
+    "ca.id, ca.collection_target_id, ca.language_code, ca.search_term_used, "
+    "ca.attempt_status_id, ca.error_type_id, ca.error_message, ca.created_at"
+)
+
 
 class CollectionAttemptsDAO:
     """DAO for collection_attempts table"""
@@ -31,13 +37,12 @@ class CollectionAttemptsDAO:
 
         query = """
             INSERT INTO collection_attempts
-            (collection_target_id, language_code, search_term_used, attempt_status_id, error_type_id, error_message, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            (collection_target_id, language_code, search_term_used, attempt_status_id, error_type_id, error_message)
+            VALUES (%s, %s, %s, %s, %s, %s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
             params = (
                 collection_target_id,
                 language_code,
@@ -45,13 +50,15 @@ class CollectionAttemptsDAO:
                 attempt_status_id,
                 error_type_id,
                 error_message,
-                current_timestamp,
             )
             result = self.db.execute_insert_query(query, params)
 
             if result:
                 self.logger.info(
-                    f"Created collection attempt for config '{collection_target_id}': {search_term_used} ({language_code})",
+                    "Created collection attempt for config '%s': %s (%s)",
+                    collection_target_id,
+                    search_term_used,
+                    language_code,
                 )
                 return result
             self.logger.error(
@@ -88,13 +95,13 @@ class CollectionAttemptsDAO:
     def get_all(self) -> List[CollectionAttempts]:
         """Gets all collection attempts"""
 
-        query = """
-            SELECT * FROM collection_attempts ORDER BY created_at DESC
+        query = f"""
+            SELECT {ATTEMPT_COLUMNS} FROM collection_attempts ca ORDER BY ca.created_at DESC
         """
 
         try:
-            results = self.db.execute_select_query(query)
-            return [CollectionAttempts.from_dict(row) for row in results]
+            results = self.db.execute_select_query_tuples(query)
+            return CollectionAttempts.from_rows(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting all collection attempts: {general_error}")
@@ -106,13 +113,13 @@ class CollectionAttemptsDAO:
     ) -> List[CollectionAttempts]:
         """Gets all attempts for a specific collection target"""
 
-        query = """
-            SELECT * FROM collection_attempts WHERE collection_target_id = %s ORDER BY created_at DESC
+        query = f"""
+            SELECT {ATTEMPT_COLUMNS} FROM collection_attempts ca WHERE ca.collection_target_id = %s ORDER BY ca.created_at DESC
         """
 
         try:
-            results = self.db.execute_select_query(query, (collection_target_id,))
-            return [CollectionAttempts.from_dict(row) for row in results]
+            results = self.db.execute_select_query_tuples(query, (collection_target_id,))
+            return CollectionAttempts.from_rows(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting attempts for target '{collection_target_id}': {general_error}")
@@ -124,8 +131,8 @@ class CollectionAttemptsDAO:
     ) -> List[CollectionAttempts]:
         """Gets attempts by status name"""
 
-        query = """
-            SELECT ca.*
+        query = f"""
+            SELECT {ATTEMPT_COLUMNS}
             FROM collection_attempts ca
             JOIN attempt_statuses ast ON ca.attempt_status_id = ast.id
             WHERE ast.attempt_status_name = %s
@@ -133,8 +140,8 @@ class CollectionAttemptsDAO:
         """
 
         try:
-            results = self.db.execute_select_query(query, (attempt_status_name,))
-            attempts = [CollectionAttempts.from_dict(row) for row in results]
+            results = self.db.execute_select_query_tuples(query, (attempt_status_name,))
+            attempts = CollectionAttempts.from_rows(results)
 
             self.logger.info(f"Found {len(attempts)} attempts with status '{attempt_status_name}'")
             return attempts
@@ -182,8 +189,8 @@ class CollectionAttemptsDAO:
     ) -> List[CollectionAttempts]:
         """Gets attempts by error type name"""
 
-        query = """
-            SELECT ca.*
+        query = f"""
+            SELECT {ATTEMPT_COLUMNS}
             FROM collection_attempts ca
             JOIN error_types et ON ca.error_type_id = et.id
             WHERE et.error_type_name = %s
@@ -191,8 +198,8 @@ class CollectionAttemptsDAO:
         """
 
         try:
-            results = self.db.execute_select_query(query, (error_type_name,))
-            attempts = [CollectionAttempts.from_dict(row) for row in results]
+            results = self.db.execute_select_query_tuples(query, (error_type_name,))
+            attempts = CollectionAttempts.from_rows(results)
 
             self.logger.info(f"Found {len(attempts)} attempts with error type '{error_type_name}'")
             return attempts
@@ -387,7 +394,7 @@ class CollectionAttemptsDAO:
         try:
             search_pattern = f"%{search_term_used}%"
             results = self.db.execute_select_query(query, (search_pattern,))
-            return [CollectionAttempts.from_dict(row) for row in results]
+            return CollectionAttempts.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error searching attempts by term '{search_term_used}': {general_error}")
@@ -408,7 +415,7 @@ class CollectionAttemptsDAO:
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
             results = self.db.execute_select_query(query, (cutoff_time,))
-            return [CollectionAttempts.from_dict(row) for row in results]
+            return CollectionAttempts.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting recent attempts from last {hours} hours: {general_error}")
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -11,6 +10,11 @@ class CollectionStatusesDAO:
         self.db = get_database()
         self.logger = get_logger(__name__)
 
+        self.db.prepare_statement(
+            "collection_statuses_id_by_name",
+            "SELECT id FROM collection_statuses WHERE collection_status_name = $1",
+        )
+
     def create_collection_status(
         self,
         collection_status_name: str,
@@ -18,14 +22,13 @@ class CollectionStatusesDAO:
         """Creates a new collection status"""
 
         query = """
-            INSERT INTO collection_statuses (collection_status_name, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO collection_statuses (collection_status_name)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (collection_status_name, current_timestamp, current_timestamp)
+            params = (collection_status_name,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
@@ -86,12 +89,8 @@ class CollectionStatusesDAO:
     ) -> Optional[int]:
         """Gets collection status ID by name"""
 
-        query = """
-            SELECT id FROM collection_statuses WHERE collection_status_name = %s
-        """
-
         try:
-            results = self.db.execute_select_query(query, (collection_status_name,))
+            results = self.db.execute_prepared_select_query("collection_statuses_id_by_name", (collection_status_name,))
             if results:
                 tmp: int = results[0]["id"]
                 return tmp
@@ -127,12 +126,12 @@ class CollectionStatusesDAO:
 
         query = """
             UPDATE collection_statuses
-            SET collection_status_name = %s, updated_at = %s
+            SET collection_status_name = %s, updated_at = NOW()
             WHERE id = %s
         """
 
         try:
-            params = (collection_status_name, datetime.now(), status_id)
+            params = (collection_status_name, status_id)
             affected_rows = self.db.execute_update_delete_query(query, params)
 
             if affected_rows > 0:
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from epochai.common.database.database import get_database
@@ -30,21 +29,18 @@ class CollectionTargetsDAO:
 
         query = """
             INSERT INTO collection_targets
-            (collector_name_id, collection_type_id, language_code, collection_name, collection_status_id, updated_at, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            (collector_name_id, collection_type_id, language_code, collection_name, collection_status_id)
+            VALUES (%s, %s, %s, %s, %s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
             params = (
                 collector_name_id,
                 collection_type_id,
                 language_code,
                 collection_name,
                 collection_status_id,
-                current_timestamp,
-                current_timestamp,
             )
             result = self.db.execute_insert_query(query, params)
 
@@ -76,7 +72,7 @@ class CollectionTargetsDAO:
 
         try:
             results = self.db.execute_select_query(query, (id_list,))
-            return [CollectionTargets.from_dict(row) for row in results] if results else None
+            return CollectionTargets.from_dicts(results) if results else None
 
         except Exception as general_error:
             self.logger.error(f"Error getting collection target by id {id_list}: {general_error}")
@@ -97,12 +93,32 @@ class CollectionTargetsDAO:
                 )
                 return []
 
-            return [CollectionTargets.from_dict(row) for row in results]
+            return CollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting all collection targets: {general_error}")
             return []
 
+    def count_grouped_by_type_lang_status(self) -> List[Tuple[int, str, int, int]]:
+        """
+        Counts targets per collection type, language and status
+
+        Returns:
+            List of (collection_type_id, language_code, collection_status_id, count) tuples
+        """
+        query = """
+            SELECT collection_type_id, language_code, collection_status_id, COUNT(*)
+            FROM collection_targets
+            GROUP BY collection_type_id, language_code, collection_status_id
+        """
+
+        try:
+            return self.db.execute_select_query_tuples(query)
+
+        except Exception as general_error:
+            self.logger.error(f"Error counting collection targets by type, language and status: {general_error}")
+            return []
+
     def get_by_collection_status_id(
         self,
         collection_status_id: int,
@@ -115,7 +131,7 @@ class CollectionTargetsDAO:
 
         try:
             results = self.db.execute_select_query(query, (collection_status_id,))
-            return [CollectionTargets.from_dict(row) for row in results]
+            return CollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -153,7 +169,7 @@ class CollectionTargetsDAO:
 
         try:
             results = self.db.execute_select_query(query, params)
-            return [CollectionTargets.from_dict(row) for row in results]
+            return CollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -161,6 +177,80 @@ class CollectionTargetsDAO:
             )
             return []
 
+    def get_by_types_and_languages(
+        self,
+        collection_type_ids: List[int],
+        language_codes: List[str],
+        collection_status_id: Optional[int] = None,
+    ) -> List[CollectionTargets]:
+        """
+        Gets targets matching any of the collection types and any of the languages, optionally filtered by status
+        """
+        params: Any
+        if collection_status_id is not None:
+            query = """
+                SELECT * FROM collection_targets
+                WHERE collection_type_id = ANY(%s)
+                AND language_code = ANY(%s)
+                AND collection_status_id = %s
+                ORDER BY created_at ASC
+            """
+            params = (collection_type_ids, language_codes, collection_status_id)
+        else:
+            query = """
+                SELECT * FROM collection_targets
+                WHERE collection_type_id = ANY(%s)
+                AND language_code = ANY(%s)
+                ORDER BY created_at ASC
+            """
+            params = (collection_type_ids, language_codes)
+
+        try:
+            results = self.db.execute_select_query(query, params)
+            return CollectionTargets.from_dicts(results)
+
+        except Exception as general_error:
+            self.logger.error(
+                f"Error getting targets for type IDs {collection_type_ids} and languages {language_codes}: {general_error}",
+            )
+            return []
+
+    def get_by_collector_name_id_and_languages(
+        self,
+        collector_name_id: int,
+        language_codes: List[str],
+        collection_status_id: Optional[int] = None,
+    ) -> List[CollectionTargets]:
+        """Gets a collector's targets in any of the languages, optionally filtered by status"""
+        params: Any
+        if collection_status_id is not None:
+            query = """
+                SELECT * FROM collection_targets
+                WHERE collector_name_id = %s
+                AND language_code = ANY(%s)
+                AND collection_status_id = %s
+                ORDER BY language_code, created_at ASC
+            """
+            params = (collector_name_id, language_codes, collection_status_id)
+        else:
+            query = """
+                SELECT * FROM collection_targets
+                WHERE collector_name_id = %s
+                AND language_code = ANY(%s)
+                ORDER BY language_code, created_at ASC
+            """
+            params = (collector_name_id, language_codes)
+
+        try:
+            results = self.db.execute_select_query(query, params)
+            return CollectionTargets.from_dicts(results)
+
+        except Exception as general_error:
+            self.logger.error(
+                f"Error getting targets for collector ID {collector_name_id} and languages {language_codes}: {general_error}",
+            )
+            return []
+
     def get_by_collector_name_id(
         self,
         collector_name_id: int,
@@ -206,7 +296,7 @@ class CollectionTargetsDAO:
 
         try:
             results = self.db.execute_select_query(query, params)
-            return [CollectionTargets.from_dict(row) for row in results]
+            return CollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -239,7 +329,7 @@ class CollectionTargetsDAO:
 
         try:
             results = self.db.execute_select_query(query, params)
-            targets = [CollectionTargets.from_dict(row) for row in results]
+            targets = CollectionTargets.from_dicts(results)
 
             self.logger.info(
                 f"Found {len(targets)} targets for collection type ID {collection_type_id}",
@@ -280,14 +370,14 @@ class CollectionTargetsDAO:
         query = """
             UPDATE collection_targets
             SET collection_status_id = %s,
-            updated_at = %s
+            updated_at = NOW()
             WHERE id = %s
         """
 
         try:
             affected_rows = self.db.execute_update_delete_query(
                 query,
-                (collection_status_id, datetime.now(), target_id),
+                (collection_status_id, target_id),
             )
 
             if affected_rows > 0:
@@ -318,13 +408,12 @@ class CollectionTargetsDAO:
 
         query = """
             INSERT INTO collection_targets
-            (collector_name_id, collection_type_id, language_code, collection_name, collection_status_id, updated_at, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            (collector_name_id, collection_type_id, language_code, collection_name, collection_status_id)
+            VALUES (%s, %s, %s, %s, %s)
         """
 
         try:
             operations = []
-            now = datetime.now()
 
             for config_data in collection_targets:
                 (
@@ -340,8 +429,6 @@ class CollectionTargetsDAO:
                     language_code,
                     collection_name,
                     collection_status_id,
-                    now,
-                    now,
                 )
                 operations.append((query, params))
 
@@ -393,7 +480,7 @@ class CollectionTargetsDAO:
         try:
             search_pattern = f"%{search_term}%"
             results = self.db.execute_select_query(query, (search_pattern,))
-            return [CollectionTargets.from_dict(row) for row in results]
+            return CollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error searching targets by name '{search_term}': {general_error}")
@@ -414,7 +501,7 @@ class CollectionTargetsDAO:
 
         try:
             results = self.db.execute_select_query(query, (collector_name_id, collection_type_id))
-            return [CollectionTargets.from_dict(row) for row in results]
+            return CollectionTargets.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -18,14 +17,13 @@ class CollectionTypesDAO:
         """Creates a new collection type"""
 
         query = """
-            INSERT INTO collection_types (collection_type, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO collection_types (collection_type)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (collection_type, current_timestamp, current_timestamp)
+            params = (collection_type,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -15,14 +14,13 @@ class CollectorNamesDAO:
         """Creates a new collector name"""
 
         query = """
-            INSERT INTO collector_names (collector_name, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO collector_names (collector_name)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (collector_name, current_timestamp, current_timestamp)
+            params = (collector_name,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
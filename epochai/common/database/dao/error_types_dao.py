@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -18,14 +17,13 @@ class ErrorTypesDAO:
         """Creates a new error type"""
 
         query = """
-            INSERT INTO error_types (error_type_name, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO error_types (error_type_name)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (error_type_name, current_timestamp, current_timestamp)
+            params = (error_type_name,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
@@ -1,6 +1,6 @@
 from datetime import datetime
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from epochai.common.database.database import get_database
 from epochai.common.database.models import RawData
@@ -12,6 +12,31 @@ class RawDataDAO:
         self.db = get_database()
         self.logger = get_logger(__name__)
 
+        # Run once per collected item, so it is planned once per connection rather than on every insert
+        self.db.prepare_statement(
+            "raw_data_insert_with_attempt",
+            """
+            WITH statuses AS (
+                SELECT ast.id AS attempt_status_id, vs.id AS validation_status_id
+                FROM attempt_statuses ast
+                CROSS JOIN validation_statuses vs
+                WHERE ast.attempt_status_name = $1 AND vs.validation_status_name = $2
+            ),
+            new_attempt AS (
+                INSERT INTO collection_attempts
+                (collection_target_id, language_code, search_term_used, attempt_status_id)
+                SELECT $3, $4, $5, attempt_status_id FROM statuses
+                RETURNING id
+            )
+            INSERT INTO raw_data
+            (collection_attempt_id, raw_data_metadata_schema_id, title, language_code,
+             url, metadata, validation_status_id, validation_error, filepath_of_save)
+            SELECT new_attempt.id, $6, $5, $4, $7, $8, statuses.validation_status_id, $9, $10
+            FROM new_attempt CROSS JOIN statuses
+            RETURNING id
+            """,
+        )
+
     def create_raw_data(
         self,
         collection_attempt_id: int,
@@ -34,13 +59,12 @@ class RawDataDAO:
         query = """
             INSERT INTO raw_data
             (collection_attempt_id, raw_data_metadata_schema_id , title, language_code,
-             url, metadata, validation_status_id, validation_error, filepath_of_save, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+             url, metadata, validation_status_id, validation_error, filepath_of_save)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
             validation_error_json = json.dumps(validation_error) if validation_error else None
             # CHANGE HERE: Convert metadata to JSON string
             metadata_json = json.dumps(metadata) if metadata else None
@@ -55,15 +79,12 @@ class RawDataDAO:
                 validation_status_id,
                 validation_error_json,
                 filepath_of_save,
-                current_timestamp,
             )
 
             result = self.db.execute_insert_query(query, params)
 
             if result:
-                self.logger.info(
-                    f"Created raw data: '{title}' (attempt_id: {collection_attempt_id})",
-                )
+                self.logger.info("Created raw data: '%s' (attempt_id: %s)", title, collection_attempt_id)
                 return result
             self.logger.error(f"Failed to create raw data: '{title}'")
             return None
@@ -72,6 +93,59 @@ class RawDataDAO:
             self.logger.error(f"Error creating raw data '{title}': {general_error}")
             return None
 
+    def create_raw_data_with_attempt(
+        self,
+        collection_target_id: int,
+        attempt_status_name: str,
+        raw_data_metadata_schema_id: int,
+        title: str,
+        language_code: str,
+        validation_status_name: str,
+        url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        validation_error: Optional[Dict[str, Any]] = None,
+        filepath_of_save: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Creates a collection attempt and its raw data record in a single statement,
+        resolving both status names inline so nothing is inserted if either name is unknown
+
+        Returns:
+            The id of created raw data or None if it fails
+        """
+
+        try:
+            validation_error_json = json.dumps(validation_error) if validation_error else None
+            metadata_json = json.dumps(metadata) if metadata else None
+
+            params = (
+                attempt_status_name,
+                validation_status_name,
+                collection_target_id,
+                language_code,
+                title,
+                raw_data_metadata_schema_id,
+                url,
+                metadata_json,
+                validation_error_json,
+                filepath_of_save,
+            )
+
+            result = self.db.execute_prepared_insert_query("raw_data_insert_with_attempt", params)
+
+            if result:
+                self.logger.info("Created raw data with attempt: '%s' (collection_target_id: %s)", title, collection_target_id)
+                return result
+            self.logger.error(
+                f"Failed to create raw data with attempt: '{title}' "
+                f"(attempt status: '{attempt_status_name}', validation status: '{validation_status_name}')",
+            )
+            return None
+
+        except Exception as general_error:
+            self.logger.error(f"Error creating raw data with attempt '{title}': {general_error}")
+            return None
+
     def get_by_id(
         self,
         raw_data_id: int,
@@ -98,6 +172,20 @@ class RawDataDAO:
     ) -> List[RawData]:
         """Gets all raw datas with an optional limit"""
 
+        try:
+            return list(self.iter_all(limit))
+
+        except Exception as general_error:
+            self.logger.error(f"Error getting all raw datas: {general_error}")
+            return []
+
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        itersize: int = 1000,
+    ) -> Iterator[RawData]:
+        """Streams all raw datas through a server-side cursor without loading the whole table, errors propagate"""
+
         query = """
             SELECT * FROM raw_data ORDER BY created_at DESC
         """
@@ -105,13 +193,8 @@ class RawDataDAO:
         if limit:
             query += f" LIMIT {limit}"
 
-        try:
-            results = self.db.execute_select_query(query)
-            return [RawData.from_dict(row) for row in results]
-
-        except Exception as general_error:
-            self.logger.error(f"Error getting all raw datas: {general_error}")
-            return []
+        for row in self.db.iter_select_query(query, itersize=itersize):
+            yield RawData.from_dict(row)
 
     def get_by_attempt_id(
         self,
@@ -125,7 +208,7 @@ class RawDataDAO:
 
         try:
             results = self.db.execute_select_query(query, (collection_attempt_id,))
-            return [RawData.from_dict(row) for row in results]
+            return RawData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting raw data for attempt {collection_attempt_id}: {general_error}")
@@ -147,7 +230,7 @@ class RawDataDAO:
 
         try:
             results = self.db.execute_select_query(query, (validation_status_name,))
-            raw_data = [RawData.from_dict(row) for row in results]
+            raw_data = RawData.from_dicts(results)
 
             self.logger.info(
                 f"Found {len(raw_data)} raw data with validation status '{validation_status_name}'",
@@ -246,7 +329,7 @@ class RawDataDAO:
         try:
             search_pattern = f"%{search_term}%"
             results = self.db.execute_select_query(query, (search_pattern,))
-            return [RawData.from_dict(row) for row in results]
+            return RawData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error searching raw data by title '{search_term}': {general_error}")
@@ -279,7 +362,7 @@ class RawDataDAO:
                 results = self.db.execute_select_query(query, params)
             else:
                 results = self.db.execute_select_query(query, params)
-            return [RawData.from_dict(row) for row in results]
+            return RawData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(
@@ -392,7 +475,7 @@ class RawDataDAO:
 
             cutoff_time = datetime.now() - timedelta(hours=hours)
             results = self.db.execute_select_query(query, (cutoff_time,))
-            return [RawData.from_dict(row) for row in results]
+            return RawData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting recent contents from last {hours} hours: {general_error}")
@@ -515,7 +598,7 @@ class RawDataDAO:
 
         try:
             results = self.db.execute_select_query(query, (filepath,))
-            return [RawData.from_dict(row) for row in results]
+            return RawData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting raw data by filepath '{filepath}': {general_error}")
@@ -535,7 +618,7 @@ class RawDataDAO:
 
         try:
             results = self.db.execute_select_query(query, (schema_id,))
-            return [RawData.from_dict(row) for row in results]
+            return RawData.from_dicts(results)
 
         except Exception as general_error:
             self.logger.error(f"Error getting raw data by schema id {schema_id}: {general_error}")
@@ -27,13 +27,12 @@ class RunCollectionMetadataDAO:
         query = """
             INSERT INTO run_collection_metadata
             (collection_attempt_id, run_type_id, run_status_id, attempts_successful,
-             attempts_failed, config_used, completed_at, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+             attempts_failed, config_used, completed_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
             config_json = json.dumps(config_used) if config_used else None
 
             params = (
@@ -44,7 +43,6 @@ class RunCollectionMetadataDAO:
                 attempts_failed,
                 config_json,
                 completed_at,
-                current_timestamp,
             )
 
             result = self.db.execute_insert_query(query, params)
@@ -113,7 +111,7 @@ class RunCollectionMetadataDAO:
 
         try:
             results = self.db.execute_select_query(query, (run_type_name,))
-            runs = [RunCollectionMetadata.from_dict(row) for row in results]
+            runs = RunCollectionMetadata.from_dicts(results)
 
             self.logger.info(f"Found {len(runs)} runs of type '{run_type_name}'")
             return runs
@@ -138,7 +136,7 @@ class RunCollectionMetadataDAO:
 
         try:
             results = self.db.execute_select_query(query, (run_status_name,))
-            runs = [RunCollectionMetadata.from_dict(row) for row in results]
+            runs = RunCollectionMetadata.from_dicts(results)
 
             self.logger.info(f"Found {len(runs)} runs with status '{run_status_name}'")
             return runs
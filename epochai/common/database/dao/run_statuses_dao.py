@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -18,14 +17,13 @@ class RunStatusesDAO:
         """Creates a new run status"""
 
         query = """
-            INSERT INTO run_statuses (run_status_name, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO run_statuses (run_status_name)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (run_status_name, current_timestamp, current_timestamp)
+            params = (run_status_name,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import List, Optional
 
 from epochai.common.database.database import get_database
@@ -11,6 +10,16 @@ class ValidationStatusesDAO:
         self.db = get_database()
         self.logger = get_logger(__name__)
 
+        self.db.prepare_statement(
+            "validation_statuses_by_id",
+            "SELECT id, validation_status_name, updated_at, created_at FROM validation_statuses WHERE id = $1",
+        )
+        self.db.prepare_statement(
+            "validation_statuses_by_name",
+            "SELECT id, validation_status_name, updated_at, created_at FROM validation_statuses "
+            "WHERE validation_status_name = $1",
+        )
+
     def create_validation_status(
         self,
         validation_status_name: str,
@@ -18,14 +27,13 @@ class ValidationStatusesDAO:
         """Creates a new validation status"""
 
         query = """
-            INSERT INTO validation_statuses (validation_status_name, created_at, updated_at)
-            VALUES (%s, %s, %s)
+            INSERT INTO validation_statuses (validation_status_name)
+            VALUES (%s)
             RETURNING id
         """
 
         try:
-            current_timestamp = datetime.now()
-            params = (validation_status_name, current_timestamp, current_timestamp)
+            params = (validation_status_name,)
             result = self.db.execute_insert_query(query, params)
 
             if result:
@@ -44,12 +52,8 @@ class ValidationStatusesDAO:
     ) -> Optional[ValidationStatuses]:
         """Gets validation status by ID"""
 
-        query = """
-            SELECT * FROM validation_statuses WHERE id = %s
-        """
-
         try:
-            results = self.db.execute_select_query(query, (status_id,))
+            results = self.db.execute_prepared_select_query("validation_statuses_by_id", (status_id,))
             if results:
                 return ValidationStatuses.from_dict(results[0])
             return None
@@ -64,12 +68,8 @@ class ValidationStatusesDAO:
     ) -> Optional[ValidationStatuses]:
         """Gets validation status by name"""
 
-        query = """
-            SELECT * FROM validation_statuses WHERE validation_status_name = %s
-        """
-
         try:
-            results = self.db.execute_select_query(query, (validation_status_name,))
+            results = self.db.execute_prepared_select_query("validation_statuses_by_name", (validation_status_name,))
             if results:
                 return ValidationStatuses.from_dict(results[0])
             return None
@@ -84,12 +84,12 @@ class ValidationStatusesDAO:
         """Get all validation statuses"""
 
         query = """
-            SELECT * FROM validation_statuses ORDER BY validation_status_name
+            SELECT id, validation_status_name, updated_at, created_at FROM validation_statuses ORDER BY validation_status_name
         """
 
         try:
-            results = self.db.execute_select_query(query)
-            return [ValidationStatuses.from_dict(row) for row in results]
+            results = self.db.execute_select_query_tuples(query)
+            return [ValidationStatuses.from_row(row) for row in results]
 
         except Exception as general_error:
             self.logger.error(f"Error getting all validation statuses: {general_error}")
@@ -1,7 +1,8 @@
 from contextlib import contextmanager
 import os
 import threading
-from typing import Any, cast, Dict, List, Optional
+from typing import Any, cast, Dict, Iterator, List, Optional, Set
+import uuid
 
 from dotenv import load_dotenv
 import psycopg2
@@ -19,37 +20,71 @@ class DatabaseConnection:
     def __init__(self):
         self.logger = get_logger(__name__)
         self._connection_parameters = self._load_connection_params()
+        self._connection_options = self._load_connection_options()
         self._connection = None
 
-    def _load_connection_params(self) -> Dict[str, str]:
-        """Loads database connection parameters via environment variables"""
+        # Prepared statements are per session, so registered ones are re-prepared lazily after every reconnect
+        self._prepared_statements: Dict[str, str] = {}
+        self._prepared_on_connection: Set[str] = set()
 
-        connection_params = {
-            "host": os.getenv("DB_HOST"),
-            "port": os.getenv("DB_PORT"),
-            "database": os.getenv("DB_NAME"),
-            "user": os.getenv("DB_USER"),
-            "password": os.getenv("DB_PASSWORD"),
-        }
+    _REQUIRED_ENV_VARS = (
+        ("host", "DB_HOST"),
+        ("port", "DB_PORT"),
+        ("database", "DB_NAME"),
+        ("user", "DB_USER"),
+        ("password", "DB_PASSWORD"),
+    )
+
+    def _load_connection_params(self) -> Dict[str, Any]:
+        """Loads database connection parameters via environment variables"""
+        environ = os.environ
 
-        missing_vars = [key for key, value in connection_params.items() if value is None]
+        missing_vars = [key for key, env_var in self._REQUIRED_ENV_VARS if env_var not in environ]
         if missing_vars:
             raise ValueError(f"Missing required enviroment variables: {missing_vars}")
 
+        connection_params: Dict[str, Any] = {key: environ[env_var] for key, env_var in self._REQUIRED_ENV_VARS}
+
+        try:
+            connection_params["port"] = int(connection_params["port"])
+        except ValueError as value_error:
+            raise ValueError(f"DB_PORT must be an integer, got: '{connection_params['port']}'") from value_error
+
         self.logger.info(
-            f"Database connection configured for: {connection_params['host']}:{connection_params['port']}:{connection_params['database']}",  # noqa
+            "Database connection configured for: %s:%s:%s",
+            connection_params["host"],
+            connection_params["port"],
+            connection_params["database"],
         )
 
         return connection_params
 
+    def _load_connection_options(self) -> Dict[str, Any]:
+        """
+        Loads optional libpq tuning parameters
+
+        Note: a DB_HOST starting with '/' is used by libpq as a unix socket directory, skipping TCP entirely
+        """
+
+        return {
+            "sslmode": os.getenv("DB_SSLMODE", "prefer"),
+            "application_name": os.getenv("DB_APPLICATION_NAME", "epochai"),
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 3,
+        }
+
     def connect_to_database(self) -> bool:
         """Establish connection to the database"""
         try:
             self._connection = psycopg2.connect(
                 **cast(dict, self._connection_parameters),
+                **self._connection_options,
                 cursor_factory=RealDictCursor,
             )
             self._connection.autocommit = False
+            self._prepared_on_connection.clear()
             self.logger.info("Successfully connected to database")
             return True
 
@@ -71,6 +106,7 @@ class DatabaseConnection:
                 self.logger.error(f"Error closing database connection: {general_error}")
             finally:
                 self._connection = None
+                self._prepared_on_connection.clear()
 
     def check_if_connected(self) -> bool:
         """Checks if database connection is active or not"""
@@ -97,14 +133,21 @@ class DatabaseConnection:
         return True
 
     @contextmanager
-    def get_cursor(self):
-        """Context manager for database cursors with automatic connnection handling"""
+    def get_cursor(self, cursor_factory=None, name: Optional[str] = None, withhold: bool = False):
+        """
+        Context manager for database cursors with automatic connnection handling
+
+        Args:
+            cursor_factory: psycopg2 cursor class to use, defaults to the connection's RealDictCursor
+            name: Opens a server-side (named) cursor when given
+            withhold: Keeps a named cursor open across commits on the connection
+        """
         if not self.ensure_connection():
             raise Exception("Could not establish database connection")
 
         cursor = None
         try:
-            cursor = self._connection.cursor()
+            cursor = self._connection.cursor(name=name, cursor_factory=cursor_factory, withhold=withhold)
             yield cursor
         except Exception as general_error:
             if self._connection:
@@ -128,6 +171,93 @@ class DatabaseConnection:
 
             return results
 
+    def execute_select_query_tuples(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+    ) -> List[tuple]:
+        """Executes SELECT query and returns its results as plain tuples in column order"""
+        with self.get_cursor(cursor_factory=psycopg2.extensions.cursor) as cursor:
+            cursor.execute(query, params)
+
+            results: List[tuple] = cursor.fetchall()
+
+            return results
+
+    def iter_select_query(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        itersize: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Executes SELECT query through a server-side cursor, yielding rows in batches of itersize
+
+        Note: the cursor is declared WITH HOLD since it shares the singleton connection, so a commit by another
+        query while the rows are being consumed does not close it (Postgres materialises the remaining rows at
+        that commit). A rollback on the connection still closes it and the next batch fetch raises
+        """
+        with self.get_cursor(name=f"stream_{uuid.uuid4().hex}", withhold=True) as cursor:
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+
+            yield from cursor
+
+    def prepare_statement(
+        self,
+        name: str,
+        query: str,
+    ) -> None:
+        """Registers a query (using $1, $2... placeholders) to be run as a server-side prepared statement"""
+        self._prepared_statements[name] = query
+
+    def execute_prepared_select_query(
+        self,
+        name: str,
+        params: tuple = (),
+    ) -> List[Dict[str, Any]]:
+        """Executes a registered prepared statement, preparing it on the current connection if needed"""
+        if name not in self._prepared_statements:
+            raise ValueError(f"No prepared statement registered with name '{name}'")
+
+        with self.get_cursor() as cursor:
+            self._execute_prepared(cursor, name, params)
+            results: List[Dict[str, Any]] = cursor.fetchall()
+
+            return results
+
+    def execute_prepared_insert_query(
+        self,
+        name: str,
+        params: tuple = (),
+    ) -> Optional[int]:
+        """Executes a registered prepared INSERT ... RETURNING id and returns the inserted row's ID"""
+        if name not in self._prepared_statements:
+            raise ValueError(f"No prepared statement registered with name '{name}'")
+
+        with self.get_cursor() as cursor:
+            self._execute_prepared(cursor, name, params)
+            result = cursor.fetchone() if cursor.description else None
+            self._connection.commit()
+
+            return int(result["id"]) if result else None
+
+    def _execute_prepared(
+        self,
+        cursor,
+        name: str,
+        params: tuple,
+    ) -> None:
+        if name not in self._prepared_on_connection:
+            cursor.execute(f"PREPARE {name} AS {self._prepared_statements[name]}")
+            self._prepared_on_connection.add(name)
+
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+
     def execute_insert_query(
         self,
         query: str,
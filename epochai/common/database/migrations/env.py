@@ -69,9 +69,14 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # Pending revisions share one transaction so an upgrade commits once.
+        # Revisions using autocommit_block (CONCURRENTLY index builds, constraint
+        # validation) commit everything run before them, so a failure only rolls
+        # back to the last such block and leaves the earlier revisions applied
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            transaction_per_migration=False,
         )
 
         with context.begin_transaction():
@@ -6,338 +6,209 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
-def upgrade():
-    # LOOKUP TABLES
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS collector_names (
-            id SERIAL PRIMARY KEY,
-            collector_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
-
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS collection_types(
-            id SERIAL PRIMARY KEY,
-            collection_type  TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
-
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS collection_statuses (
-            id SERIAL PRIMARY KEY,
-            collection_status_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
-
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS attempt_statuses (
-            id SERIAL PRIMARY KEY,
-            attempt_status_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
-
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS error_types (
-            id SERIAL PRIMARY KEY,
-            error_type_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
-
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS validation_statuses (
-            id SERIAL PRIMARY KEY,
-            validation_status_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
-
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS run_types (
-            id SERIAL PRIMARY KEY,
-            run_type_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+# Greenfield installs only. This revision was reworked after release: batched DDL, lookup DDL built from
+# LOOKUP_TABLES, main table columns reordered to avoid alignment padding, and B-tree indexes moved to 004.
+# Databases created by the original 001 are not rewritten to match. They keep its column order, which only
+# differs physically since every query names its columns or reads rows by name. Revisions 004 onwards use
+# IF [NOT] EXISTS, so both layouts upgrade to the same logical schema
+
+# LOOKUP TABLES
+# (table name, name column), every lookup table shares the same shape
+LOOKUP_TABLES = [
+    ("collector_names", "collector_name"),
+    ("collection_types", "collection_type"),
+    ("collection_statuses", "collection_status_name"),
+    ("attempt_statuses", "attempt_status_name"),
+    ("error_types", "error_type_name"),
+    ("validation_statuses", "validation_status_name"),
+    ("run_types", "run_type_name"),
+    ("run_statuses", "run_status_name"),
+]
+
+LOOKUP_TABLE_TEMPLATE = """
+    CREATE TABLE IF NOT EXISTS {table_name} (
+        id SERIAL PRIMARY KEY,
+        {name_column} TEXT NOT NULL UNIQUE,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+    );
+"""
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS run_statuses (
-            id SERIAL PRIMARY KEY,
-            run_status_name TEXT NOT NULL UNIQUE,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+LOOKUP_TABLES_SQL = "".join(
+    LOOKUP_TABLE_TEMPLATE.format(table_name=table_name, name_column=name_column)
+    for table_name, name_column in LOOKUP_TABLES
+)
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS raw_data_metadata_schemas (
-            id SERIAL PRIMARY KEY,
-            metadata_schema JSONB NOT NULL,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+# METADATA SCHEMA TABLES
+METADATA_SCHEMA_TABLES_SQL = """
+    CREATE TABLE IF NOT EXISTS raw_data_metadata_schemas (
+        id SERIAL PRIMARY KEY,
+        metadata_schema JSONB NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+    );
 
-    op.execute("""
     CREATE TABLE IF NOT EXISTS cleaned_data_metadata_schemas (
         id SERIAL PRIMARY KEY,
         metadata_schema JSONB NOT NULL,
         updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
         created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
     );
-    """)
+"""
 
-    # MAIN TABLES
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS collection_targets(
-            id SERIAL PRIMARY KEY,
-            collector_name_id INTEGER NOT NULL REFERENCES collector_names(id) ON DELETE RESTRICT,
-            collection_type_id INTEGER NOT NULL REFERENCES collection_types(id) ON DELETE RESTRICT,
-            language_code TEXT NOT NULL,
-            collection_name TEXT NOT NULL,
-            collection_status_id INTEGER NOT NULL REFERENCES collection_statuses(id) ON DELETE RESTRICT,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+# MAIN TABLES
+# Columns are ordered 8-byte (timestamps, ids that become BIGINT), then 4-byte, then variable width,
+# with a 4-byte column paired next to any INTEGER id so no alignment padding is left between them
+MAIN_TABLES_SQL = """
+    CREATE TABLE IF NOT EXISTS collection_targets(
+        id SERIAL PRIMARY KEY,
+        collector_name_id INTEGER NOT NULL REFERENCES collector_names(id) ON DELETE RESTRICT,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        collection_type_id INTEGER NOT NULL REFERENCES collection_types(id) ON DELETE RESTRICT,
+        collection_status_id INTEGER NOT NULL REFERENCES collection_statuses(id) ON DELETE RESTRICT,
+        language_code TEXT NOT NULL,
+        collection_name TEXT NOT NULL,
 
-            CONSTRAINT ensure_collection_target_is_unique UNIQUE(collector_name_id, collection_type_id, language_code, collection_name)
-        );
-    """)
+        CONSTRAINT ensure_collection_target_is_unique UNIQUE(collector_name_id, collection_type_id, language_code, collection_name)
+    );
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS collection_attempts(
-            id SERIAL PRIMARY KEY,
-            collection_target_id INTEGER NOT NULL REFERENCES collection_targets(id) ON DELETE RESTRICT,
-            language_code TEXT NOT NULL,
-            search_term_used TEXT NOT NULL,
-            attempt_status_id INTEGER NOT NULL REFERENCES attempt_statuses(id) ON DELETE RESTRICT,
-            error_type_id INTEGER REFERENCES error_types(id) ON DELETE RESTRICT,
-            error_message TEXT,
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+    CREATE TABLE IF NOT EXISTS collection_attempts(
+        id SERIAL PRIMARY KEY,
+        collection_target_id INTEGER NOT NULL REFERENCES collection_targets(id) ON DELETE RESTRICT,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        attempt_status_id INTEGER NOT NULL REFERENCES attempt_statuses(id) ON DELETE RESTRICT,
+        error_type_id INTEGER REFERENCES error_types(id) ON DELETE RESTRICT,
+        language_code TEXT NOT NULL,
+        search_term_used TEXT NOT NULL,
+        error_message TEXT
+    );
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS raw_data (
-            id SERIAL PRIMARY KEY,
-            collection_attempt_id INTEGER NOT NULL REFERENCES collection_attempts(id) ON DELETE CASCADE,
-            raw_data_metadata_schema_id INTEGER NOT NULL REFERENCES raw_data_metadata_schemas(id) ON DELETE RESTRICT,
-            title TEXT NOT NULL,
-            language_code TEXT NOT NULL,
-            url TEXT NULL,
-            metadata jsonb NOT NULL,
-            validation_status_id INTEGER NOT NULL REFERENCES validation_statuses(id) ON DELETE RESTRICT,
-            validation_error JSON,
-            filepath_of_save TEXT NULL,
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+    CREATE TABLE IF NOT EXISTS raw_data (
+        id SERIAL PRIMARY KEY,
+        collection_attempt_id INTEGER NOT NULL REFERENCES collection_attempts(id) ON DELETE CASCADE,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        raw_data_metadata_schema_id INTEGER NOT NULL REFERENCES raw_data_metadata_schemas(id) ON DELETE RESTRICT,
+        validation_status_id INTEGER NOT NULL REFERENCES validation_statuses(id) ON DELETE RESTRICT,
+        title TEXT NOT NULL,
+        language_code TEXT NOT NULL,
+        url TEXT NULL,
+        metadata jsonb NOT NULL,
+        validation_error JSON,
+        filepath_of_save TEXT NULL
+    );
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS check_collection_targets (
-            id SERIAL PRIMARY KEY,
-            collection_target_id INTEGER NOT NULL REFERENCES collection_targets(id) ON DELETE CASCADE,
-            search_term_used TEXT NOT NULL,
-            language_code TEXT NOT NULL,
-            test_status TEXT NOT NULL,
-            search_results_found JSON NOT NULL DEFAULT '[]',
-            error_message TEXT NOT NULL DEFAULT '',
-            test_duration INTEGER NOT NULL,
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+    CREATE TABLE IF NOT EXISTS check_collection_targets (
+        id SERIAL PRIMARY KEY,
+        collection_target_id INTEGER NOT NULL REFERENCES collection_targets(id) ON DELETE CASCADE,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        test_duration INTEGER NOT NULL,
+        search_term_used TEXT NOT NULL,
+        language_code TEXT NOT NULL,
+        test_status TEXT NOT NULL,
+        search_results_found JSON NOT NULL DEFAULT '[]',
+        error_message TEXT NOT NULL DEFAULT ''
+    );
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS run_collection_metadata (
-            id SERIAL PRIMARY KEY,
-            collection_attempt_id INTEGER REFERENCES collection_attempts(id) ON DELETE SET NULL,
-            run_type_id INTEGER NOT NULL  REFERENCES run_types(id) ON DELETE RESTRICT,
-            run_status_id INTEGER NOT NULL REFERENCES run_statuses(id) ON DELETE RESTRICT,
-            attempts_successful INTEGER NOT NULL DEFAULT 0,
-            attempts_failed INTEGER NOT NULL DEFAULT 0,
-            config_used JSON,
-            completed_at TIMESTAMP WITH TIME ZONE,
-            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-        );
-    """)
+    CREATE TABLE IF NOT EXISTS run_collection_metadata (
+        id SERIAL PRIMARY KEY,
+        run_type_id INTEGER NOT NULL  REFERENCES run_types(id) ON DELETE RESTRICT,
+        collection_attempt_id INTEGER REFERENCES collection_attempts(id) ON DELETE SET NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        completed_at TIMESTAMP WITH TIME ZONE,
+        run_status_id INTEGER NOT NULL REFERENCES run_statuses(id) ON DELETE RESTRICT,
+        attempts_successful INTEGER NOT NULL DEFAULT 0,
+        attempts_failed INTEGER NOT NULL DEFAULT 0,
+        config_used JSON
+    );
 
-    op.execute("""
-        CREATE TABLE IF NOT EXISTS link_attempts_to_runs (
-            id SERIAL PRIMARY KEY,
-            collection_attempt_id INTEGER NOT NULL REFERENCES collection_attempts(id) ON DELETE CASCADE,
-            run_collection_metadata_id INTEGER NOT NULL REFERENCES run_collection_metadata(id) ON DELETE CASCADE,
+    CREATE TABLE IF NOT EXISTS link_attempts_to_runs (
+        id SERIAL PRIMARY KEY,
+        collection_attempt_id INTEGER NOT NULL REFERENCES collection_attempts(id) ON DELETE CASCADE,
+        run_collection_metadata_id INTEGER NOT NULL REFERENCES run_collection_metadata(id) ON DELETE CASCADE,
 
-            CONSTRAINT unique_attempt_to_runs UNIQUE (collection_attempt_id, run_collection_metadata_id)
-        );
-    """)
+        CONSTRAINT unique_attempt_to_runs UNIQUE (collection_attempt_id, run_collection_metadata_id)
+    );
 
-    op.execute("""
     CREATE TABLE IF NOT EXISTS cleaned_data (
         id SERIAL PRIMARY KEY,
         raw_data_id INTEGER NOT NULL REFERENCES raw_data(id) ON DELETE CASCADE,
+        cleaned_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
         cleaned_data_metadata_schema_id INTEGER NOT NULL REFERENCES cleaned_data_metadata_schemas(id) ON DELETE RESTRICT,
+        validation_status_id INTEGER NOT NULL REFERENCES validation_statuses(id) ON DELETE RESTRICT,
+        cleaning_time_ms INTEGER NOT NULL,
         title TEXT NOT NULL,
         language_code TEXT NOT NULL,
         url TEXT NULL,
         metadata jsonb NOT NULL,
-        validation_status_id INTEGER NOT NULL REFERENCES validation_statuses(id) ON DELETE RESTRICT,
         validation_error JSON,
         cleaner_used TEXT NOT NULL,
         cleaner_version TEXT NOT NULL,
-        cleaning_time_ms INTEGER NOT NULL,
-        cleaned_at TIMESTAMP WITH TIME ZONE NOT NULL,
-        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
 
         CONSTRAINT uk_cleaned_data_raw_cleaner_version UNIQUE (cleaner_used, cleaner_version, raw_data_id)
     );
-    """)
-
-    # INDEXES
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_targets_collector_types ON collection_targets(collector_name_id, collection_type_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_targets_collection_statuses ON collection_targets(collection_status_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_targets_language_code ON collection_targets(language_code);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_attempts_config_id ON collection_attempts(collection_target_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_attempts_status_id ON collection_attempts(attempt_status_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_attempts_created_at ON collection_attempts(created_at);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_attempts_error_type_id ON collection_attempts(error_type_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_raw_data_attempt_id ON raw_data(collection_attempt_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_raw_data_validation_status_id ON raw_data(validation_status_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_raw_data_title ON raw_data(title);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_raw_data_created_at ON raw_data(created_at);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_check_collection_targets_collection_target_id ON check_collection_targets(collection_target_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_check_collection_targets_test_status ON check_collection_targets(test_status);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_check_collection_targets_created_at ON check_collection_targets(created_at);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_run_collection_metadata_run_type_id ON run_collection_metadata(run_type_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_run_collection_metadata_run_status_id ON run_collection_metadata(run_status_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_run_collection_metadata_created_at ON run_collection_metadata(created_at);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_link_attempts_to_runs_collection_attempt_id ON link_attempts_to_runs(collection_attempt_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_link_attempts_to_runs_run_collection_metadata_id ON link_attempts_to_runs(run_collection_metadata_id);
-    """)
-    op.execute("""
-    CREATE INDEX IF NOT EXISTS idx_cleaned_data_raw_data_id ON cleaned_data(raw_data_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_cleaned_data_validation_status_id ON cleaned_data(validation_status_id);
-    """)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS idx_cleaned_data_created_at ON cleaned_data(created_at);
-    """)
-
-    # COMMENTS
-    op.execute("""
-        COMMENT ON TABLE collector_names IS 'Lookup table for different collectors';
-    """)
-    op.execute("""
-        COMMENT ON TABLE collection_types IS 'Lookup table for collection types';
-    """)
-    op.execute("""
-        COMMENT ON TABLE collection_targets IS 'Configuration of what needs to be collected';
-    """)
-    op.execute("""
-        COMMENT ON TABLE collection_statuses IS 'Lookup table for collection target statuses';
-    """)
-    op.execute("""
-        COMMENT ON TABLE collection_attempts IS 'Log of each collection attempt';
-    """)
-    op.execute("""
-        COMMENT ON TABLE raw_data IS 'Table storing collected content from collectors';
-    """)
-    op.execute("""
-        COMMENT ON TABLE check_collection_targets IS 'Results from debug testing of collection targets';
-    """)
-    op.execute("""
-        COMMENT ON TABLE run_collection_metadata IS 'Metadata about collection runs and their performance';
-    """)
-    op.execute("""
-        COMMENT ON TABLE link_attempts_to_runs IS 'Link table between collection_attempts and run_collection_metadata';
-    """)
-    op.execute("""
+"""
+
+# COMMENTS
+TABLE_COMMENTS_SQL = """
+    COMMENT ON TABLE collector_names IS 'Lookup table for different collectors';
+    COMMENT ON TABLE collection_types IS 'Lookup table for collection types';
+    COMMENT ON TABLE collection_targets IS 'Configuration of what needs to be collected';
+    COMMENT ON TABLE collection_statuses IS 'Lookup table for collection target statuses';
+    COMMENT ON TABLE collection_attempts IS 'Log of each collection attempt';
+    COMMENT ON TABLE raw_data IS 'Table storing collected content from collectors';
+    COMMENT ON TABLE check_collection_targets IS 'Results from debug testing of collection targets';
+    COMMENT ON TABLE run_collection_metadata IS 'Metadata about collection runs and their performance';
+    COMMENT ON TABLE link_attempts_to_runs IS 'Link table between collection_attempts and run_collection_metadata';
     COMMENT ON TABLE cleaned_data IS 'Table storing cleaned data derived from raw_data table';
-    """)
-    op.execute("""
-        COMMENT ON TABLE cleaned_data_metadata_schemas IS 'Schema definitions for cleaned data metadata validation';
-    """)
+    COMMENT ON TABLE cleaned_data_metadata_schemas IS 'Schema definitions for cleaned data metadata validation';
+"""
+
+# COLUMN COMMENTS
+COLUMN_COMMENTS_SQL = """
+    COMMENT ON COLUMN collection_attempts.language_code IS 'Actual language code used during the collection attempt';
+    COMMENT ON COLUMN collection_attempts.search_term_used IS 'Actual search term used during collection attempt';
+    COMMENT ON COLUMN raw_data.validation_error IS 'JSON object containing the validation error details if the validation has failed';
+    COMMENT ON COLUMN check_collection_targets.test_duration IS 'Test duration in miliseconds';
+    COMMENT ON COLUMN run_collection_metadata.config_used IS 'JSON of configuration used during the run';
+"""
+
+# Executed as one multi-statement batch so the whole schema is created in a single round trip
+DDL_SCRIPT = "\n".join(
+    [
+        LOOKUP_TABLES_SQL,
+        METADATA_SCHEMA_TABLES_SQL,
+        MAIN_TABLES_SQL,
+        TABLE_COMMENTS_SQL,
+        COLUMN_COMMENTS_SQL,
+    ]
+)
+
+DROP_SCRIPT = """
+    DROP TABLE IF EXISTS
+        link_attempts_to_runs,
+        run_collection_metadata,
+        check_collection_targets,
+        raw_data,
+        collection_attempts,
+        collection_targets,
+        cleaned_data,
+        raw_data_metadata_schemas,
+        cleaned_data_metadata_schemas,
+        run_statuses,
+        run_types,
+        validation_statuses,
+        error_types,
+        attempt_statuses,
+        collection_statuses,
+        collection_types,
+        collector_names
+    CASCADE;
+"""
 
-    # COLUMN COMMENTS
-    op.execute("""
-        COMMENT ON COLUMN collection_attempts.language_code IS 'Actual language code used during the collection attempt';
-    """)
-    op.execute("""
-        COMMENT ON COLUMN collection_attempts.search_term_used IS 'Actual search term used during collection attempt';
-    """)
-    op.execute("""
-        COMMENT ON COLUMN raw_data.validation_error IS 'JSON object containing the validation error details if the validation has failed';
-    """)
-    op.execute("""
-        COMMENT ON COLUMN check_collection_targets.test_duration IS 'Test duration in miliseconds';
-    """)
-    op.execute("""
-        COMMENT ON COLUMN run_collection_metadata.config_used IS 'JSON of configuration used during the run';
-    """)
+def upgrade():
+    op.execute(DDL_SCRIPT)
 
 def downgrade():
-    op.execute("DROP TABLE IF EXISTS link_attempts_to_runs CASCADE;")
-    op.execute("DROP TABLE IF EXISTS run_collection_metadata CASCADE;")
-    op.execute("DROP TABLE IF EXISTS check_collection_targets CASCADE;")
-    op.execute("DROP TABLE IF EXISTS raw_data CASCADE;")
-    op.execute("DROP TABLE IF EXISTS collection_attempts CASCADE;")
-    op.execute("DROP TABLE IF EXISTS collection_targets CASCADE;")
-    op.execute("DROP TABLE IF EXISTS cleaned_data CASCADE;")
-
-    op.execute("DROP TABLE IF EXISTS raw_data_metadata_schemas CASCADE;")
-    op.execute("DROP TABLE IF EXISTS cleaned_data_metadata_schemas CASCADE;")
-    op.execute("DROP TABLE IF EXISTS run_statuses CASCADE;")
-    op.execute("DROP TABLE IF EXISTS run_types CASCADE;")
-    op.execute("DROP TABLE IF EXISTS validation_statuses CASCADE;")
-    op.execute("DROP TABLE IF EXISTS error_types CASCADE;")
-    op.execute("DROP TABLE IF EXISTS attempt_statuses CASCADE;")
-    op.execute("DROP TABLE IF EXISTS collection_statuses CASCADE;")
-    op.execute("DROP TABLE IF EXISTS collection_types CASCADE;")
-    op.execute("DROP TABLE IF EXISTS collector_names CASCADE;")
+    op.execute(DROP_SCRIPT)
@@ -0,0 +1,46 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+# JSON columns are stored as text and re-parsed on every read, JSONB matches the existing metadata columns
+UPGRADE_SQL = """
+    ALTER TABLE raw_data
+        ALTER COLUMN validation_error TYPE JSONB USING validation_error::jsonb;
+
+    ALTER TABLE cleaned_data
+        ALTER COLUMN validation_error TYPE JSONB USING validation_error::jsonb;
+
+    ALTER TABLE check_collection_targets
+        ALTER COLUMN search_results_found DROP DEFAULT,
+        ALTER COLUMN search_results_found TYPE JSONB USING search_results_found::jsonb,
+        ALTER COLUMN search_results_found SET DEFAULT '[]'::jsonb;
+
+    ALTER TABLE run_collection_metadata
+        ALTER COLUMN config_used TYPE JSONB USING config_used::jsonb;
+"""
+
+DOWNGRADE_SQL = """
+    ALTER TABLE raw_data
+        ALTER COLUMN validation_error TYPE JSON USING validation_error::json;
+
+    ALTER TABLE cleaned_data
+        ALTER COLUMN validation_error TYPE JSON USING validation_error::json;
+
+    ALTER TABLE check_collection_targets
+        ALTER COLUMN search_results_found DROP DEFAULT,
+        ALTER COLUMN search_results_found TYPE JSON USING search_results_found::json,
+        ALTER COLUMN search_results_found SET DEFAULT '[]';
+
+    ALTER TABLE run_collection_metadata
+        ALTER COLUMN config_used TYPE JSON USING config_used::json;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
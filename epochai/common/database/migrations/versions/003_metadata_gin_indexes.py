@@ -0,0 +1,24 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+# jsonb_path_ops only supports containment (@>) but is much smaller and faster than the default jsonb_ops
+UPGRADE_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_raw_data_metadata_gin ON raw_data USING GIN (metadata jsonb_path_ops);
+    CREATE INDEX IF NOT EXISTS idx_cleaned_data_metadata_gin ON cleaned_data USING GIN (metadata jsonb_path_ops);
+"""
+
+DOWNGRADE_SQL = """
+    DROP INDEX IF EXISTS idx_raw_data_metadata_gin;
+    DROP INDEX IF EXISTS idx_cleaned_data_metadata_gin;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
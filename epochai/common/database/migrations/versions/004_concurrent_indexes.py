@@ -0,0 +1,43 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+# (index name, table and columns), built with CONCURRENTLY so writers are not blocked while they build
+INDEXES = [
+    ("idx_collection_targets_collector_types", "collection_targets(collector_name_id, collection_type_id)"),
+    ("idx_collection_targets_collection_statuses", "collection_targets(collection_status_id)"),
+    ("idx_collection_targets_language_code", "collection_targets(language_code)"),
+    ("idx_collection_attempts_status_id", "collection_attempts(attempt_status_id)"),
+    ("idx_collection_attempts_created_at", "collection_attempts(created_at)"),
+    ("idx_collection_attempts_error_type_id", "collection_attempts(error_type_id)"),
+    ("idx_raw_data_attempt_id", "raw_data(collection_attempt_id)"),
+    ("idx_raw_data_validation_status_id", "raw_data(validation_status_id)"),
+    ("idx_raw_data_title", "raw_data(title)"),
+    ("idx_raw_data_created_at", "raw_data(created_at)"),
+    ("idx_check_collection_targets_collection_target_id", "check_collection_targets(collection_target_id)"),
+    ("idx_check_collection_targets_test_status", "check_collection_targets(test_status)"),
+    ("idx_check_collection_targets_created_at", "check_collection_targets(created_at)"),
+    ("idx_run_collection_metadata_run_type_id", "run_collection_metadata(run_type_id)"),
+    ("idx_run_collection_metadata_run_status_id", "run_collection_metadata(run_status_id)"),
+    ("idx_run_collection_metadata_created_at", "run_collection_metadata(created_at)"),
+    ("idx_link_attempts_to_runs_collection_attempt_id", "link_attempts_to_runs(collection_attempt_id)"),
+    ("idx_link_attempts_to_runs_run_collection_metadata_id", "link_attempts_to_runs(run_collection_metadata_id)"),
+    ("idx_cleaned_data_raw_data_id", "cleaned_data(raw_data_id)"),
+    ("idx_cleaned_data_validation_status_id", "cleaned_data(validation_status_id)"),
+    ("idx_cleaned_data_created_at", "cleaned_data(created_at)"),
+]
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so each index is its own statement
+    with op.get_context().autocommit_block():
+        for index_name, index_definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {index_definition};")
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index_name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};")
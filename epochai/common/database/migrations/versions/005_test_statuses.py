@@ -0,0 +1,62 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# check_collection_targets.test_status moves from free TEXT to a FK into a lookup table, like the other *_statuses
+UPGRADE_SQL = """
+    CREATE TABLE IF NOT EXISTS test_statuses (
+        id SERIAL PRIMARY KEY,
+        test_status_name TEXT NOT NULL UNIQUE,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+    );
+
+    INSERT INTO test_statuses (test_status_name)
+    SELECT test_status_name FROM (VALUES ('success'), ('failed'), ('failed_with_suggestions')) AS seed(test_status_name)
+    UNION
+    SELECT DISTINCT test_status FROM check_collection_targets
+    ON CONFLICT (test_status_name) DO NOTHING;
+
+    ALTER TABLE check_collection_targets
+        ADD COLUMN test_status_id INTEGER REFERENCES test_statuses(id) ON DELETE RESTRICT;
+
+    UPDATE check_collection_targets cct
+    SET test_status_id = ts.id
+    FROM test_statuses ts
+    WHERE ts.test_status_name = cct.test_status;
+
+    ALTER TABLE check_collection_targets ALTER COLUMN test_status_id SET NOT NULL;
+
+    DROP INDEX IF EXISTS idx_check_collection_targets_test_status;
+    ALTER TABLE check_collection_targets DROP COLUMN test_status;
+    CREATE INDEX IF NOT EXISTS idx_check_collection_targets_test_status_id ON check_collection_targets(test_status_id);
+
+    COMMENT ON TABLE test_statuses IS 'Lookup table for the outcome of a collection target check';
+"""
+
+DOWNGRADE_SQL = """
+    ALTER TABLE check_collection_targets ADD COLUMN test_status TEXT;
+
+    UPDATE check_collection_targets cct
+    SET test_status = ts.test_status_name
+    FROM test_statuses ts
+    WHERE ts.id = cct.test_status_id;
+
+    ALTER TABLE check_collection_targets ALTER COLUMN test_status SET NOT NULL;
+
+    DROP INDEX IF EXISTS idx_check_collection_targets_test_status_id;
+    ALTER TABLE check_collection_targets DROP COLUMN test_status_id;
+    CREATE INDEX IF NOT EXISTS idx_check_collection_targets_test_status ON check_collection_targets(test_status);
+
+    DROP TABLE IF EXISTS test_statuses;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
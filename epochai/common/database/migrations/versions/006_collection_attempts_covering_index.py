@@ -0,0 +1,25 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+# Serves "latest attempts (with a given status) per target" without a bitmap AND across single column indexes,
+# the leading collection_target_id also makes idx_collection_attempts_config_id redundant
+COVERING_INDEX_NAME = "idx_collection_attempts_target_status_created"
+COVERING_INDEX_DEFINITION = "collection_attempts(collection_target_id, attempt_status_id, created_at DESC) INCLUDE (error_type_id)"
+
+REPLACED_INDEX_NAME = "idx_collection_attempts_config_id"
+REPLACED_INDEX_DEFINITION = "collection_attempts(collection_target_id)"
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {COVERING_INDEX_NAME} ON {COVERING_INDEX_DEFINITION};")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {REPLACED_INDEX_NAME};")
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {REPLACED_INDEX_NAME} ON {REPLACED_INDEX_DEFINITION};")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {COVERING_INDEX_NAME};")
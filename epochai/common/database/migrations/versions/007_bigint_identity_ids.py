@@ -0,0 +1,62 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+# High volume tables move from SERIAL (INT4 + owned sequence) to BIGINT GENERATED ALWAYS AS IDENTITY,
+# lookup and config tables stay on SERIAL since they will never come near the INT4 ceiling
+IDENTITY_TABLES = [
+    "collection_attempts",
+    "raw_data",
+    "cleaned_data",
+    "link_attempts_to_runs",
+]
+
+# (table, column) pairs referencing the ids above, widened so they can hold every id
+REFERENCING_COLUMNS = [
+    ("raw_data", "collection_attempt_id"),
+    ("run_collection_metadata", "collection_attempt_id"),
+    ("link_attempts_to_runs", "collection_attempt_id"),
+    ("cleaned_data", "raw_data_id"),
+]
+
+SERIAL_TO_IDENTITY_TEMPLATE = """
+    ALTER TABLE {table_name} ALTER COLUMN id DROP DEFAULT;
+    DROP SEQUENCE IF EXISTS {table_name}_id_seq;
+    ALTER TABLE {table_name} ALTER COLUMN id TYPE BIGINT;
+    ALTER TABLE {table_name} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY;
+    SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table_name};
+"""
+
+IDENTITY_TO_SERIAL_TEMPLATE = """
+    ALTER TABLE {table_name} ALTER COLUMN id DROP IDENTITY IF EXISTS;
+    ALTER TABLE {table_name} ALTER COLUMN id TYPE INTEGER;
+    CREATE SEQUENCE IF NOT EXISTS {table_name}_id_seq AS INTEGER OWNED BY {table_name}.id;
+    ALTER TABLE {table_name} ALTER COLUMN id SET DEFAULT nextval('{table_name}_id_seq');
+    SELECT setval('{table_name}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table_name};
+"""
+
+UPGRADE_SQL = "".join(
+    [SERIAL_TO_IDENTITY_TEMPLATE.format(table_name=table_name) for table_name in IDENTITY_TABLES]
+    + [
+        f"\n    ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE BIGINT;"
+        for table_name, column_name in REFERENCING_COLUMNS
+    ]
+)
+
+DOWNGRADE_SQL = "".join(
+    [
+        f"\n    ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE INTEGER;"
+        for table_name, column_name in REFERENCING_COLUMNS
+    ]
+    + [IDENTITY_TO_SERIAL_TEMPLATE.format(table_name=table_name) for table_name in IDENTITY_TABLES]
+)
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
@@ -0,0 +1,30 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+# created_at on these append-mostly tables is only used for range filters, never ORDER BY ... LIMIT,
+# so a BRIN summary per block range does the job at a fraction of the B-tree size.
+# raw_data, cleaned_data and collection_attempts keep B-tree as their DAOs page through ORDER BY created_at DESC LIMIT n
+BRIN_INDEXES = [
+    ("idx_check_collection_targets_created_at", "check_collection_targets"),
+    ("idx_run_collection_metadata_created_at", "run_collection_metadata"),
+]
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for index_name, table_name in BRIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name} "
+                f"USING BRIN (created_at) WITH (pages_per_range = 32);"
+            )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index_name, table_name in BRIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};")
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name}(created_at);")
@@ -0,0 +1,36 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+# Full schema validation stays in SchemaUtils, this only rejects metadata that is not a JSON object at all.
+# Added NOT VALID and committed, then validated outside the migration transaction. VALIDATE CONSTRAINT only
+# takes a SHARE UPDATE EXCLUSIVE lock, so existing rows are checked without blocking writes
+UPGRADE_SQL = """
+    ALTER TABLE raw_data
+        ADD CONSTRAINT raw_data_metadata_is_object CHECK (jsonb_typeof(metadata) = 'object') NOT VALID;
+
+    ALTER TABLE cleaned_data
+        ADD CONSTRAINT cleaned_data_metadata_is_object CHECK (jsonb_typeof(metadata) = 'object') NOT VALID;
+"""
+
+VALIDATE_SQL = """
+    ALTER TABLE raw_data VALIDATE CONSTRAINT raw_data_metadata_is_object;
+    ALTER TABLE cleaned_data VALIDATE CONSTRAINT cleaned_data_metadata_is_object;
+"""
+
+DOWNGRADE_SQL = """
+    ALTER TABLE raw_data DROP CONSTRAINT IF EXISTS raw_data_metadata_is_object;
+    ALTER TABLE cleaned_data DROP CONSTRAINT IF EXISTS cleaned_data_metadata_is_object;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+    with op.get_context().autocommit_block():
+        op.execute(VALIDATE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
@@ -0,0 +1,26 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+# collection_targets (status changes) and run_collection_metadata (progress counters) are updated in place,
+# leaving free space on each page lets those updates stay HOT and skip index maintenance.
+# Applies to newly written pages, existing pages pick it up as they are rewritten by VACUUM FULL / CLUSTER
+UPGRADE_SQL = """
+    ALTER TABLE collection_targets SET (fillfactor = 80);
+    ALTER TABLE run_collection_metadata SET (fillfactor = 80);
+"""
+
+DOWNGRADE_SQL = """
+    ALTER TABLE collection_targets RESET (fillfactor);
+    ALTER TABLE run_collection_metadata RESET (fillfactor);
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
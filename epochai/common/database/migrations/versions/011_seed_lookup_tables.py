@@ -0,0 +1,67 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# (table name, name column, names), mirrors the fixed sets in epochai.common.enums at the time of this revision.
+# Collector names and collection types come from config so they are not seeded here
+LOOKUP_SEEDS = [
+    ("collection_statuses", "collection_status_name", [
+        "not_collected",
+        "collected",
+        "failed",
+        "check_failed",
+    ]),
+    ("attempt_statuses", "attempt_status_name", [
+        "success",
+        "failed",
+        "pending",
+        "timed out",
+        "cancelled",
+    ]),
+    ("error_types", "error_type_name", [
+        "page_not_found",
+        "disambiguation_error",
+        "network_timeout",
+        "api_rate_limit",
+        "invalid_language_code",
+        "content_too_short",
+        "access_denied_error",
+        "server_error",
+        "parsing_error",
+        "encoding_error",
+        "unknown_error",
+    ]),
+    ("validation_statuses", "validation_status_name", [
+        "valid",
+        "invalid",
+        "pending",
+        "warning",
+        "skipped",
+    ]),
+]
+
+SEED_TEMPLATE = """
+    INSERT INTO {table_name} ({name_column})
+    VALUES {values}
+    ON CONFLICT ({name_column}) DO NOTHING;
+"""
+
+SEED_SQL = "".join(
+    SEED_TEMPLATE.format(
+        table_name=table_name,
+        name_column=name_column,
+        values=", ".join(f"('{name}')" for name in names),
+    )
+    for table_name, name_column, names in LOOKUP_SEEDS
+)
+
+def upgrade():
+    op.execute(SEED_SQL)
+
+def downgrade():
+    # Seeded rows may already have existed before this revision and are referenced with ON DELETE RESTRICT
+    pass
@@ -0,0 +1,72 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# cleaned_data.cleaner_used / cleaner_version move into a cleaners lookup. The unique key becomes (raw_data_id, cleaner_id),
+# leading with raw_data_id so it also serves raw_data_id lookups and makes idx_cleaned_data_raw_data_id redundant
+UPGRADE_SQL = """
+    CREATE TABLE IF NOT EXISTS cleaners (
+        id SMALLSERIAL PRIMARY KEY,
+        cleaner_name TEXT NOT NULL,
+        cleaner_version TEXT NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+        CONSTRAINT uk_cleaners_name_version UNIQUE (cleaner_name, cleaner_version)
+    );
+
+    INSERT INTO cleaners (cleaner_name, cleaner_version)
+    SELECT DISTINCT cleaner_used, cleaner_version FROM cleaned_data
+    ON CONFLICT (cleaner_name, cleaner_version) DO NOTHING;
+
+    ALTER TABLE cleaned_data ADD COLUMN cleaner_id SMALLINT REFERENCES cleaners(id) ON DELETE RESTRICT;
+
+    UPDATE cleaned_data cd
+    SET cleaner_id = c.id
+    FROM cleaners c
+    WHERE c.cleaner_name = cd.cleaner_used AND c.cleaner_version = cd.cleaner_version;
+
+    ALTER TABLE cleaned_data ALTER COLUMN cleaner_id SET NOT NULL;
+
+    ALTER TABLE cleaned_data DROP CONSTRAINT IF EXISTS uk_cleaned_data_raw_cleaner_version;
+    ALTER TABLE cleaned_data DROP COLUMN cleaner_used, DROP COLUMN cleaner_version;
+    ALTER TABLE cleaned_data ADD CONSTRAINT uk_cleaned_data_raw_cleaner UNIQUE (raw_data_id, cleaner_id);
+
+    DROP INDEX IF EXISTS idx_cleaned_data_raw_data_id;
+    CREATE INDEX IF NOT EXISTS idx_cleaned_data_cleaner_id ON cleaned_data(cleaner_id);
+
+    COMMENT ON TABLE cleaners IS 'Lookup table for the cleaner name and version that produced cleaned data';
+"""
+
+DOWNGRADE_SQL = """
+    ALTER TABLE cleaned_data ADD COLUMN cleaner_used TEXT, ADD COLUMN cleaner_version TEXT;
+
+    UPDATE cleaned_data cd
+    SET cleaner_used = c.cleaner_name, cleaner_version = c.cleaner_version
+    FROM cleaners c
+    WHERE c.id = cd.cleaner_id;
+
+    ALTER TABLE cleaned_data
+        ALTER COLUMN cleaner_used SET NOT NULL,
+        ALTER COLUMN cleaner_version SET NOT NULL;
+
+    DROP INDEX IF EXISTS idx_cleaned_data_cleaner_id;
+    CREATE INDEX IF NOT EXISTS idx_cleaned_data_raw_data_id ON cleaned_data(raw_data_id);
+
+    ALTER TABLE cleaned_data DROP CONSTRAINT IF EXISTS uk_cleaned_data_raw_cleaner;
+    ALTER TABLE cleaned_data DROP COLUMN cleaner_id;
+    ALTER TABLE cleaned_data
+        ADD CONSTRAINT uk_cleaned_data_raw_cleaner_version UNIQUE (cleaner_used, cleaner_version, raw_data_id);
+
+    DROP TABLE IF EXISTS cleaners;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
@@ -0,0 +1,27 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+# SchemaUtils finds its schema by name / version fields with metadata_schema @> '{...}'. The field names differ
+# between raw (collector_name) and cleaned (cleaner_name) schemas, so a containment index covers both
+UPGRADE_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_raw_data_metadata_schemas_gin
+        ON raw_data_metadata_schemas USING GIN (metadata_schema jsonb_path_ops);
+    CREATE INDEX IF NOT EXISTS idx_cleaned_data_metadata_schemas_gin
+        ON cleaned_data_metadata_schemas USING GIN (metadata_schema jsonb_path_ops);
+"""
+
+DOWNGRADE_SQL = """
+    DROP INDEX IF EXISTS idx_raw_data_metadata_schemas_gin;
+    DROP INDEX IF EXISTS idx_cleaned_data_metadata_schemas_gin;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
@@ -0,0 +1,35 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+# find_schema_by_content matches a whole schema document, which jsonb equality can only do by scanning every row.
+# jsonb::text is canonical (key order and whitespace normalised), so an md5 of it gives an indexable content key
+UPGRADE_SQL = """
+    ALTER TABLE raw_data_metadata_schemas
+        ADD COLUMN content_hash TEXT GENERATED ALWAYS AS (md5(metadata_schema::text)) STORED;
+    ALTER TABLE cleaned_data_metadata_schemas
+        ADD COLUMN content_hash TEXT GENERATED ALWAYS AS (md5(metadata_schema::text)) STORED;
+
+    CREATE INDEX IF NOT EXISTS idx_raw_data_metadata_schemas_content_hash
+        ON raw_data_metadata_schemas(content_hash);
+    CREATE INDEX IF NOT EXISTS idx_cleaned_data_metadata_schemas_content_hash
+        ON cleaned_data_metadata_schemas(content_hash);
+"""
+
+DOWNGRADE_SQL = """
+    DROP INDEX IF EXISTS idx_raw_data_metadata_schemas_content_hash;
+    DROP INDEX IF EXISTS idx_cleaned_data_metadata_schemas_content_hash;
+
+    ALTER TABLE raw_data_metadata_schemas DROP COLUMN IF EXISTS content_hash;
+    ALTER TABLE cleaned_data_metadata_schemas DROP COLUMN IF EXISTS content_hash;
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
@@ -0,0 +1,57 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+# Makes content_hash unique so get_or_create_schema can insert with ON CONFLICT DO NOTHING. Any duplicate schema
+# documents already stored are folded into the lowest id first, repointing the raw / cleaned data that used them
+UPGRADE_SQL = """
+    UPDATE raw_data rd
+    SET raw_data_metadata_schema_id = dup.keep_id
+    FROM (
+        SELECT id, MIN(id) OVER (PARTITION BY content_hash) AS keep_id FROM raw_data_metadata_schemas
+    ) dup
+    WHERE rd.raw_data_metadata_schema_id = dup.id AND dup.id <> dup.keep_id;
+
+    DELETE FROM raw_data_metadata_schemas s
+    USING raw_data_metadata_schemas k
+    WHERE s.content_hash = k.content_hash AND s.id > k.id;
+
+    UPDATE cleaned_data cd
+    SET cleaned_data_metadata_schema_id = dup.keep_id
+    FROM (
+        SELECT id, MIN(id) OVER (PARTITION BY content_hash) AS keep_id FROM cleaned_data_metadata_schemas
+    ) dup
+    WHERE cd.cleaned_data_metadata_schema_id = dup.id AND dup.id <> dup.keep_id;
+
+    DELETE FROM cleaned_data_metadata_schemas s
+    USING cleaned_data_metadata_schemas k
+    WHERE s.content_hash = k.content_hash AND s.id > k.id;
+
+    DROP INDEX IF EXISTS idx_raw_data_metadata_schemas_content_hash;
+    DROP INDEX IF EXISTS idx_cleaned_data_metadata_schemas_content_hash;
+
+    ALTER TABLE raw_data_metadata_schemas
+        ADD CONSTRAINT uk_raw_data_metadata_schemas_content_hash UNIQUE (content_hash);
+    ALTER TABLE cleaned_data_metadata_schemas
+        ADD CONSTRAINT uk_cleaned_data_metadata_schemas_content_hash UNIQUE (content_hash);
+"""
+
+DOWNGRADE_SQL = """
+    ALTER TABLE raw_data_metadata_schemas DROP CONSTRAINT IF EXISTS uk_raw_data_metadata_schemas_content_hash;
+    ALTER TABLE cleaned_data_metadata_schemas DROP CONSTRAINT IF EXISTS uk_cleaned_data_metadata_schemas_content_hash;
+
+    CREATE INDEX IF NOT EXISTS idx_raw_data_metadata_schemas_content_hash
+        ON raw_data_metadata_schemas(content_hash);
+    CREATE INDEX IF NOT EXISTS idx_cleaned_data_metadata_schemas_content_hash
+        ON cleaned_data_metadata_schemas(content_hash);
+"""
+
+def upgrade():
+    op.execute(UPGRADE_SQL)
+
+def downgrade():
+    op.execute(DOWNGRADE_SQL)
@@ -1,11 +1,79 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import starmap
 import json
-from typing import Any, Dict, List, Optional
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
 
+# orjson is optional, its JSONDecodeError subclasses json.JSONDecodeError so the handlers below cover both
+try:
+    import orjson
 
-@dataclass
-class CollectorNames:
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_Model = TypeVar("_Model")
+_Row = TypeVar("_Row", bound="_FromDictsMixin")
+
+# Slotted models skip the per-instance __dict__, dataclass only accepts slots=True from Python 3.10.
+# Type checkers only recognise a bare dataclass decorator, so they are given the dataclass_transform signature
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+
+    @dataclass_transform(field_specifiers=(field,))
+    def model_dataclass(cls: Type[_Model]) -> Type[_Model]: ...
+
+elif sys.version_info >= (3, 10):
+
+    def model_dataclass(cls: Type[_Model]) -> Type[_Model]:
+        return dataclass(slots=True)(cls)
+
+else:
+    model_dataclass = dataclass
+
+# Lookup models are immutable NamedTuples, identical rows share one instance. Keyed on the type as well since
+# tuples of different lookup models compare equal, and on the whole row so renamed rows are not served stale.
+# Cleared outright once full, the lookup tables hold far fewer rows than this between renames
+LOOKUP_INTERN_LIMIT = 256
+_interned_lookups: Dict[Tuple[Any, ...], Any] = {}
+
+
+class _FromDictsMixin:
+    """Adds from_dicts to the row models, built on each model's from_dict"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(
+        cls: Type[_Row],
+        data: Dict[str, Any],
+    ) -> _Row:
+        raise NotImplementedError
+
+    @classmethod
+    def from_dicts(
+        cls: Type[_Row],
+        rows: List[Dict[str, Any]],
+    ) -> List[_Row]:
+        """Creates instances from a list of database row dictionaries"""
+        return list(map(cls.from_dict, rows))
+
+
+def _intern_lookup(row: Any) -> Any:
+    """Returns the shared instance for a lookup row"""
+    key = (type(row), row)
+    interned = _interned_lookups.get(key)
+    if interned is not None:
+        return interned
+
+    if len(_interned_lookups) >= LOOKUP_INTERN_LIMIT:
+        _interned_lookups.clear()
+    _interned_lookups[key] = row
+    return row
+
+
+class CollectorNames(NamedTuple):
     """collector_names table model"""
 
     id: Optional[int] = None
@@ -19,16 +87,10 @@ class CollectorNames:
         data: Dict[str, Any],
     ) -> "CollectorNames":
         """Creates instance from database row dictionary"""
-        return cls(
-            id=data.get("id"),
-            collector_name=data.get("collector_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class CollectionTypes:
+class CollectionTypes(NamedTuple):
     """collection_types table model"""
 
     id: Optional[int] = None
@@ -42,16 +104,10 @@ class CollectionTypes:
         data: Dict[str, Any],
     ) -> "CollectionTypes":
         """Creates instance from database row dictionary"""
-        return cls(
-            id=data.get("id"),
-            collection_type=data.get("collection_type"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class CollectionStatuses:
+class CollectionStatuses(NamedTuple):
     """collection_statuses table model"""
 
     id: Optional[int] = None
@@ -65,16 +121,11 @@ class CollectionStatuses:
         data: Dict[str, Any],
     ) -> "CollectionStatuses":
         """Creates instance from database row dictionary"""
-        return cls(
-            id=data.get("id"),
-            collection_status_name=data.get("collection_status_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class CollectionTargets:
+@model_dataclass
+class CollectionTargets(_FromDictsMixin):
     """collection_targets table model"""
 
     id: Optional[int] = None
@@ -92,20 +143,20 @@ class CollectionTargets:
         data: Dict[str, Any],
     ) -> "CollectionTargets":
         """Creates instance from database row dictionary"""
+        g = data.get
         return cls(
-            id=data.get("id"),
-            collector_name_id=data.get("collector_name_id"),
-            collection_type_id=data.get("collection_type_id"),
-            language_code=data.get("language_code"),
-            collection_name=data.get("collection_name"),
-            collection_status_id=data.get("collection_status_id"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
+            id=g("id"),
+            collector_name_id=g("collector_name_id"),
+            collection_type_id=g("collection_type_id"),
+            language_code=g("language_code"),
+            collection_name=g("collection_name"),
+            collection_status_id=g("collection_status_id"),
+            updated_at=g("updated_at"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
-class AttemptStatuses:
+class AttemptStatuses(NamedTuple):
     """attempt_statuses table model"""
 
     id: Optional[int] = None
@@ -119,16 +170,10 @@ class AttemptStatuses:
         data: Dict[str, Any],
     ) -> "AttemptStatuses":
         """Creates instance from database row dictionary"""
-        return cls(
-            id=data.get("id"),
-            attempt_status_name=data.get("attempt_status_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class ErrorTypes:
+class ErrorTypes(NamedTuple):
     """error_types table model"""
 
     id: Optional[int] = None
@@ -142,16 +187,11 @@ class ErrorTypes:
         data: Dict[str, Any],
     ) -> "ErrorTypes":
         """Creates instance from database row dictionary"""
-        return cls(
-            id=data.get("id"),
-            error_type_name=data.get("error_type_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class CollectionAttempts:
+@model_dataclass
+class CollectionAttempts(_FromDictsMixin):
     """collection_attempts table model"""
 
     id: Optional[int] = None
@@ -169,20 +209,28 @@ class CollectionAttempts:
         data: Dict[str, Any],
     ) -> "CollectionAttempts":
         """Creates instance from database row dictionary"""
+        g = data.get
         return cls(
-            id=data.get("id"),
-            collection_target_id=data.get("collection_target_id"),
-            language_code=data.get("language_code"),
-            search_term_used=data.get("search_term_used"),
-            attempt_status_id=data.get("attempt_status_id"),
-            error_type_id=data.get("error_type_id"),
-            error_message=data.get("error_message"),
-            created_at=data.get("created_at"),
+            id=g("id"),
+            collection_target_id=g("collection_target_id"),
+            language_code=g("language_code"),
+            search_term_used=g("search_term_used"),
+            attempt_status_id=g("attempt_status_id"),
+            error_type_id=g("error_type_id"),
+            error_message=g("error_message"),
+            created_at=g("created_at"),
         )
 
+    @classmethod
+    def from_rows(
+        cls,
+        rows: List[Tuple[Any, ...]],
+    ) -> List["CollectionAttempts"]:
+        """Creates instances from tuple rows selected in field order (id, collection_target_id, ..., created_at)"""
+        return list(starmap(cls, rows))
+
 
-@dataclass
-class ValidationStatuses:
+class ValidationStatuses(NamedTuple):
     """validation_statuses table model"""
 
     id: Optional[int] = None
@@ -196,15 +244,18 @@ class ValidationStatuses:
         data: Dict[str, Any],
     ) -> "ValidationStatuses":
         """Creates instance from database row dictionary"""
-        return cls(
-            id=data.get("id"),
-            validation_status_name=data.get("validation_status_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
+    @classmethod
+    def from_row(
+        cls,
+        row: Tuple[Any, ...],
+    ) -> "ValidationStatuses":
+        """Creates instance from a tuple row selected as (id, validation_status_name, updated_at, created_at)"""
+        return _intern_lookup(cls._make(row))
 
-@dataclass
+
+@model_dataclass
 class RawDataMetadataSchemas:
     """raw_data_metadata_schemas table model"""
 
@@ -219,23 +270,24 @@ class RawDataMetadataSchemas:
         data: Dict[str, Any],
     ) -> "RawDataMetadataSchemas":
         "Creates instance from database row dictionary"
-        schema = data.get("metadata_schema")
+        g = data.get
+        schema = g("metadata_schema")
         if isinstance(schema, str):
             try:
-                schema = json.loads(schema)
+                schema = _loads(schema)
             except json.JSONDecodeError:
                 schema = {}
 
         return cls(
-            id=data.get("id"),
+            id=g("id"),
             metadata_schema=schema,
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
+            updated_at=g("updated_at"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
-class RawData:
+@model_dataclass
+class RawData(_FromDictsMixin):
     """raw_data table model"""
 
     id: Optional[int] = None
@@ -244,56 +296,51 @@ class RawData:
     title: str = ""
     language_code: str = ""
     url: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
     validation_status_id: int = 0
-    validation_error: Optional[Dict[str, Any]] = None
+    validation_error: Dict[str, Any] = field(default_factory=dict)
     filepath_of_save: str = ""
     created_at: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.validation_error is None:
-            self.validation_error = {}
-        if self.metadata is None:
-            self.metadata = {}
-
     @classmethod
     def from_dict(
         cls,
         data: Dict[str, Any],
     ) -> "RawData":
         """Creates instance from database raw dictionary"""
-        validation_error = data.get("validation_error")
+        g = data.get
+        validation_error = g("validation_error")
         if isinstance(validation_error, str):
             try:
-                validation_error = json.loads(validation_error)
+                validation_error = _loads(validation_error)
             except json.JSONDecodeError:
                 validation_error = {}
 
-        metadata = data.get("metadata")
+        metadata = g("metadata")
         if isinstance(metadata, str):
             try:
-                metadata = json.loads(metadata)
+                metadata = _loads(metadata)
             except json.JSONDecodeError:
                 metadata = {}
 
         return cls(
-            id=data.get("id"),
-            collection_attempt_id=data.get("collection_attempt_id"),
-            raw_data_metadata_schema_id=data.get("raw_data_metadata_schema_id"),
-            title=data.get("title"),
-            language_code=data.get("language_code"),
-            url=data.get("url"),
-            metadata=metadata,
-            validation_status_id=data.get("validation_status_id"),
-            validation_error=validation_error,
-            filepath_of_save=data.get("filepath_of_save"),
-            created_at=data.get("created_at"),
+            id=g("id"),
+            collection_attempt_id=g("collection_attempt_id"),
+            raw_data_metadata_schema_id=g("raw_data_metadata_schema_id"),
+            title=g("title"),
+            language_code=g("language_code"),
+            url=g("url"),
+            metadata=metadata or {},
+            validation_status_id=g("validation_status_id"),
+            validation_error=validation_error or {},
+            filepath_of_save=g("filepath_of_save"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
-class CleanedData:
-    """cleaned_data table model"""
+@model_dataclass
+class CleanedData(_FromDictsMixin):
+    """cleaned_data table model, cleaner_used and cleaner_version are joined in from cleaners"""
 
     id: Optional[int] = None
     raw_data_id: int = 0
@@ -301,60 +348,57 @@ class CleanedData:
     title: str = ""
     language_code: str = ""
     url: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
     validation_status_id: int = 0
-    validation_error: Optional[Dict[str, Any]] = None
+    validation_error: Dict[str, Any] = field(default_factory=dict)
+    cleaner_id: int = 0
     cleaner_used: str = ""
     cleaner_version: str = ""
     cleaning_time_ms: int = 0
     cleaned_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.validation_error is None:
-            self.validation_error = {}
-        if self.metadata is None:
-            self.metadata = {}
-
     @classmethod
     def from_dict(
         cls,
         data: Dict[str, Any],
     ) -> "CleanedData":
         """Creates instance from database row dictionary"""
-        validation_error = data.get("validation_error")
+        g = data.get
+        validation_error = g("validation_error")
         if isinstance(validation_error, str):
             try:
-                validation_error = json.loads(validation_error)
+                validation_error = _loads(validation_error)
             except json.JSONDecodeError:
                 validation_error = {}
 
-        metadata = data.get("metadata")
+        metadata = g("metadata")
         if isinstance(metadata, str):
             try:
-                metadata = json.loads(metadata)
+                metadata = _loads(metadata)
             except json.JSONDecodeError:
                 metadata = {}
 
         return cls(
-            id=data.get("id"),
-            raw_data_id=data.get("raw_data_id"),
-            cleaned_data_metadata_schema_id=data.get("cleaned_data_metadata_schema_id"),
-            title=data.get("title"),
-            language_code=data.get("language_code"),
-            url=data.get("url"),
-            metadata=metadata,
-            validation_status_id=data.get("validation_status_id"),
-            validation_error=validation_error,
-            cleaner_used=data.get("cleaner_used"),
-            cleaner_version=data.get("cleaner_version"),
-            cleaning_time_ms=data.get("cleaning_time_ms"),
-            cleaned_at=data.get("cleaned_at"),
-            created_at=data.get("created_at"),
+            id=g("id"),
+            raw_data_id=g("raw_data_id"),
+            cleaned_data_metadata_schema_id=g("cleaned_data_metadata_schema_id"),
+            title=g("title"),
+            language_code=g("language_code"),
+            url=g("url"),
+            metadata=metadata or {},
+            validation_status_id=g("validation_status_id"),
+            validation_error=validation_error or {},
+            cleaner_id=g("cleaner_id"),
+            cleaner_used=g("cleaner_used"),
+            cleaner_version=g("cleaner_version"),
+            cleaning_time_ms=g("cleaning_time_ms"),
+            cleaned_at=g("cleaned_at"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
+@model_dataclass
 class CleanedDataMetadataSchemas:
     """cleaned_data_metadata_schemas table model"""
 
@@ -369,23 +413,23 @@ class CleanedDataMetadataSchemas:
         data: Dict[str, Any],
     ) -> "CleanedDataMetadataSchemas":
         """Creates instance from database row dictionary"""
-        schema = data.get("metadata_schema")
+        g = data.get
+        schema = g("metadata_schema")
         if isinstance(schema, str):
             try:
-                schema = json.loads(schema)
+                schema = _loads(schema)
             except json.JSONDecodeError:
                 schema = {}
 
         return cls(
-            id=data.get("id"),
+            id=g("id"),
             metadata_schema=schema,
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
+            updated_at=g("updated_at"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
-class RunTypes:
+class RunTypes(NamedTuple):
     """run_types table"""
 
     id: Optional[int] = None
@@ -399,16 +443,10 @@ class RunTypes:
         data: Dict[str, Any],
     ) -> "RunTypes":
         """Create instance from database row dict"""
-        return cls(
-            id=data.get("id"),
-            run_type_name=data.get("run_type_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class RunStatuses:
+class RunStatuses(NamedTuple):
     """run_statuses table model"""
 
     id: Optional[int] = None
@@ -422,16 +460,11 @@ class RunStatuses:
         data: Dict[str, Any],
     ) -> "RunStatuses":
         """Creates instance from database row dict"""
-        return cls(
-            id=data.get("id"),
-            run_status_name=data.get("run_status_name"),
-            updated_at=data.get("updated_at"),
-            created_at=data.get("created_at"),
-        )
+        return _intern_lookup(cls(*map(data.get, cls._fields)))
 
 
-@dataclass
-class RunCollectionMetadata:
+@model_dataclass
+class RunCollectionMetadata(_FromDictsMixin):
     """run_collection_metadata table model"""
 
     id: Optional[int] = None
@@ -450,27 +483,28 @@ class RunCollectionMetadata:
         data: Dict[str, Any],
     ) -> "RunCollectionMetadata":
         """Creates instance from database row dict"""
-        config_used = data.get("config_used")
+        g = data.get
+        config_used = g("config_used")
         if isinstance(config_used, str):
             try:
-                config_used = json.loads(config_used)
+                config_used = _loads(config_used)
             except json.JSONDecodeError:
                 config_used = {}
 
         return cls(
-            id=data.get("id"),
-            collection_attempt_id=data.get("collection_attempt_id"),
-            run_type_id=data.get("run_type_id"),
-            run_status_id=data.get("run_status_id"),
-            attempts_successful=data.get("attempts_successful"),
-            attempts_failed=data.get("attempts_failed"),
+            id=g("id"),
+            collection_attempt_id=g("collection_attempt_id"),
+            run_type_id=g("run_type_id"),
+            run_status_id=g("run_status_id"),
+            attempts_successful=g("attempts_successful"),
+            attempts_failed=g("attempts_failed"),
             config_used=config_used,
-            completed_at=data.get("completed_at"),
-            created_at=data.get("created_at"),
+            completed_at=g("completed_at"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
+@model_dataclass
 class LinkAttemptsToRuns:
     """link_attempts_to_runs table model"""
 
@@ -483,58 +517,58 @@ class LinkAttemptsToRuns:
         cls,
         data: Dict[str, Any],
     ) -> "LinkAttemptsToRuns":
+        g = data.get
         return cls(
-            id=data.get("id"),
-            collection_attempt_id=data.get("collection_attempt_id"),
-            run_collection_metadata_id=data.get("run_collection_metadata_id"),
+            id=g("id"),
+            collection_attempt_id=g("collection_attempt_id"),
+            run_collection_metadata_id=g("run_collection_metadata_id"),
         )
 
 
-@dataclass
-class CheckCollectionTargets:
-    """debug_wikipedia_results table model"""
+@model_dataclass
+class CheckCollectionTargets(_FromDictsMixin):
+    """check_collection_targets table model, test_status is joined in from test_statuses"""
 
     id: Optional[int] = None
     collection_target_id: int = 0
     search_term_used: str = ""
     language_code: str = ""
+    test_status_id: int = 0
     test_status: str = ""
-    search_results_found: List[str] = None
+    search_results_found: List[str] = field(default_factory=list)
     error_message: str = ""
     test_duration: int = 0
     created_at: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.search_results_found is None:
-            self.search_results_found = []
-
     @classmethod
     def from_dict(
         cls,
         data: Dict[str, Any],
     ) -> "CheckCollectionTargets":
         """Creates instance from database row dict"""
-        search_results_found = data.get("search_results_found")
+        g = data.get
+        search_results_found = g("search_results_found")
         if isinstance(search_results_found, str):
             try:
-                search_results_found = json.loads(search_results_found)
+                search_results_found = _loads(search_results_found)
             except json.JSONDecodeError:
                 search_results_found = []
 
         return cls(
-            id=data.get("id"),
-            collection_target_id=data.get("collection_target_id"),
-            search_term_used=data.get("search_term_used"),
-            language_code=data.get("language_code"),
-            test_status=data.get("test_status"),
-            search_results_found=search_results_found,
-            error_message=data.get("error_message"),
-            test_duration=data.get("test_duration"),
-            created_at=data.get("created_at"),
+            id=g("id"),
+            collection_target_id=g("collection_target_id"),
+            search_term_used=g("search_term_used"),
+            language_code=g("language_code"),
+            test_status_id=g("test_status_id"),
+            test_status=g("test_status"),
+            search_results_found=search_results_found or [],
+            error_message=g("error_message"),
+            test_duration=g("test_duration"),
+            created_at=g("created_at"),
         )
 
 
-@dataclass
+@model_dataclass
 class TrackSchemaMigrations:
     id: int
     version: str
@@ -38,6 +38,12 @@ class ValidationStatusNames(Enum):
     SKIPPED = "skipped"
 
 
+class TestStatusNames(Enum):
+    SUCCESS = "success"
+    FAILED = "failed"
+    FAILED_WITH_SUGGESTIONS = "failed_with_suggestions"
+
+
 class CollectionTypeNames(Enum):
     POST_2016 = "2020-2024"
     PRE_2016 = "1968-2016"
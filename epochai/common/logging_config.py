@@ -1,6 +1,27 @@
+import atexit
 from datetime import datetime
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 import os
+import queue
+from typing import List, Optional
+
+# Console / file handlers run on the listener's thread, callers only enqueue the record
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener():
+    """Flushes queued records to the handlers and stops the listener thread"""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(log_level="INFO", log_to_file=True, log_dir="logs"):
@@ -19,8 +40,14 @@ def setup_logging(log_level="INFO", log_to_file=True, log_dir="logs"):
         log_dir = os.path.join(project_root, log_dir)
         os.makedirs(log_dir, exist_ok=True)
 
+    global _queue_listener
+
+    _stop_queue_listener()
+
+    level = getattr(logging, log_level.upper())
+
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
 
     root_logger.handlers.clear()
 
@@ -30,9 +57,9 @@ def setup_logging(log_level="INFO", log_to_file=True, log_dir="logs"):
     )
 
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     if log_to_file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -42,10 +69,25 @@ def setup_logging(log_level="INFO", log_to_file=True, log_dir="logs"):
         log_filepath = os.path.join(log_dir, log_filename)
 
         file_handler = logging.FileHandler(log_filepath)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
 
+        # Writes the file in batches of up to 1000 records, anything ERROR or above flushes straight away
+        buffered_file_handler = MemoryHandler(
+            capacity=1000,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered_file_handler.setLevel(level)
+        handlers.append(buffered_file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    if log_to_file:
         logging.info(f"Logging to file: {log_filepath}")
 
 
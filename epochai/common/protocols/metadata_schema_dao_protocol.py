@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Protocol, Union, runtime_checkable
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union, runtime_checkable
 
 from epochai.common.database.models import CleanedDataMetadataSchemas, RawDataMetadataSchemas
 
@@ -21,6 +22,26 @@ class MetadataSchemaDAOProtocol(Protocol):
         """Gets all metadata schemas"""
         ...
 
+    def get_by_name_and_version(
+        self,
+        name_field: str,
+        name: str,
+        version_field: str,
+        version: str,
+    ) -> Optional[MetadataSchemaModel]:
+        """Gets the newest schema with the given name and version"""
+        ...
+
+    def get_id_and_updated_at_by_name_and_version(
+        self,
+        name_field: str,
+        name: str,
+        version_field: str,
+        version: str,
+    ) -> Optional[Tuple[int, datetime]]:
+        """Gets only the id and updated_at of the newest schema with the given name and version"""
+        ...
+
     def find_schema_by_content(self, schema_content: Dict[str, Any]) -> Optional[MetadataSchemaModel]:
         """Finds a schema that matches the given content structure"""
         ...
@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from epochai.common.config.config_loader import ConfigLoader
@@ -7,6 +6,9 @@ from epochai.common.database.dao.raw_data_dao import RawDataDAO
 from epochai.common.database.dao.validation_statuses_dao import ValidationStatusesDAO
 from epochai.common.database.models import RawData
 from epochai.common.logging_config import get_logger
+from epochai.common.utils.database_utils import StatusIdCache
+
+_validation_status_ids = StatusIdCache(ValidationStatusesDAO, "validation_status_name")
 
 
 class CleaningService:
@@ -26,31 +28,27 @@ class CleaningService:
 
         # DAOs
         self.cleaned_data_dao = CleanedDataDAO()
-        self._validation_statuses_dao = ValidationStatusesDAO()
         self.raw_data_dao = RawDataDAO()
 
         # VALIDATION STATUS CACHING
-        self._validation_status_cache = self._load_validation_statuses()
+        self._valid_status_id = self.get_validation_status_id("valid")
+        self._invalid_status_id = self.get_validation_status_id("invalid")
 
         self.logger.debug(f"Initialized {__name__} for {cleaner_name} v{cleaner_version}")
 
-    def _load_validation_statuses(self) -> Dict[str, int]:
-        """Loads and caches validation status ids"""
-        try:
-            statuses = self._validation_statuses_dao.get_all()
-            return {status.validation_status_name: status.id for status in statuses if status.id}
-        except Exception as general_error:
-            self.logger.error(f"Failed to load validation statuses: {general_error}")
-            return {}
-
     def get_validation_status_id(
         self,
         status_name: str,
     ) -> Optional[int]:
         """Gets validation status ID"""
-        status_id = self._validation_status_cache.get(status_name)
+        try:
+            status_id = _validation_status_ids.get_id(status_name)
+        except Exception as general_error:
+            self.logger.error(f"Failed to load validation statuses: {general_error}")
+            return None
+
         if status_id is not None:
-            return int(status_id)
+            return status_id
 
         self.logger.warning(f"Validation status '{status_name}' not found")
         return None
@@ -66,7 +64,7 @@ class CleaningService:
     ) -> Optional[int]:
         """Saves cleaned content"""
         try:
-            validation_status_id: int = self.get_validation_status_id("valid" if is_valid else "invalid")
+            validation_status_id = self._valid_status_id if is_valid else self._invalid_status_id
 
             if not schema_id:
                 self.logger.error(f"No metadata schema id available for {self._cleaner_name}")
@@ -84,13 +82,15 @@ class CleaningService:
                 metadata=transformed_metadata,
                 validation_status_id=validation_status_id,
                 validation_error=validation_error,
-                cleaned_at=datetime.now(),
             )
 
             if cleaned_data_id:
                 status_msg = "valid" if is_valid else "invalid"
                 self.logger.info(
-                    f"Successfully saved cleaned data {cleaned_data_id}. ({status_msg}, {cleaning_time_ms}ms)",
+                    "Successfully saved cleaned data %s. (%s, %sms)",
+                    cleaned_data_id,
+                    status_msg,
+                    cleaning_time_ms,
                 )
 
             return cleaned_data_id
@@ -124,12 +124,11 @@ class CleaningService:
                 language_code=raw_data.language_code,
                 url=raw_data.url,
                 metadata={},
-                validation_status_id=self.get_validation_status_id("invalid"),
+                validation_status_id=self._invalid_status_id,
                 validation_error=error_dict,
                 cleaner_used=self._cleaner_name,
                 cleaner_version=self._cleaner_version,
                 cleaning_time_ms=cleaning_time_ms,
-                cleaned_at=datetime.now(),
             )
 
         except Exception as general_error:
@@ -1,14 +1,25 @@
-from typing import Any, Dict, List
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from epochai.common.database.dao.collection_statuses_dao import CollectionStatusesDAO
 from epochai.common.database.dao.collection_targets_dao import CollectionTargetsDAO
 from epochai.common.database.dao.collection_types_dao import CollectionTypesDAO
 from epochai.common.database.dao.collector_names_dao import CollectorNamesDAO
+from epochai.common.enums import CollectionStatusNames
 from epochai.common.logging_config import get_logger
 from epochai.common.utils.database_utils import DatabaseUtils
 from epochai.common.utils.decorators import handle_generic_errors_gracefully, handle_initialization_errors
 
 
+class TargetSummary(NamedTuple):
+    """Per-target projection returned by get_targets_by_type_and_status"""
+
+    id: Optional[int]
+    name: str
+    collection_status_id: int
+
+
 class CollectionReportsService:
     @handle_initialization_errors(f"{__name__} initialization")
     def __init__(self):
@@ -19,19 +30,47 @@ class CollectionReportsService:
             self._collector_names_dao = CollectorNamesDAO()
             self._collection_statuses_dao = CollectionStatusesDAO()
             self._database_utils = DatabaseUtils()
+            # name -> id lookups are repeated for the same collector / type / status names, failed lookups raise and aren't cached
+            self._get_name_type_status_ids = lru_cache(maxsize=256)(self._database_utils.get_name_type_status_ids)
+
+            # collection_statuses / collection_types are lookup tables, loaded on first use (an empty load is retried)
+            self._status_map: Optional[Dict[int, str]] = None
+            self._type_map: Optional[Dict[int, str]] = None
+
             self._logger.debug(f"Database components initialized for {CollectionReportsService.__name__}")
         except Exception as general_error:
             raise RuntimeError("Failed to initialize the database components") from general_error
 
+    def _get_status_map(self) -> Dict[int, str]:
+        """Gets the cached collection status id -> name map"""
+        if not self._status_map:
+            self._status_map = {
+                status.id: status.collection_status_name for status in self._collection_statuses_dao.get_all() if status.id
+            }
+        return self._status_map
+
+    def _get_type_map(self) -> Dict[int, str]:
+        """Gets the cached collection type id -> name map"""
+        if not self._type_map:
+            self._type_map = {
+                type_obj.id: type_obj.collection_type for type_obj in self._collection_types_dao.get_all() if type_obj.id
+            }
+        return self._type_map
+
+    def reload_lookup_maps(self) -> None:
+        """Drops the cached status / type maps so they are reloaded on next use"""
+        self._status_map = None
+        self._type_map = None
+
     @handle_generic_errors_gracefully("during retrieval of collection targets", {})
     def get_targets_by_type_and_status(
         self,
         collection_type: str,
         collection_status_name: str,
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, List[TargetSummary]]:
         """Gets uncollected targets of a specific type for a specific collector and collection status, grouped by language"""
 
-        _, collection_type_id, collection_status_id = self._database_utils.get_name_type_status_ids(
+        _, collection_type_id, collection_status_id = self._get_name_type_status_ids(
             collection_type=collection_type,
             collection_status_name=collection_status_name,
         )
@@ -41,16 +80,13 @@ class CollectionReportsService:
             collection_status_id,
         )
 
-        result = {}
-        for language_code, target_list in collection_targets.items():
-            result[language_code] = [
-                {
-                    "id": each_target.id,
-                    "name": each_target.collection_name,
-                    "collection_status_id": each_target.collection_status_id,
-                }
+        result = {
+            language_code: [
+                TargetSummary(each_target.id, each_target.collection_name, each_target.collection_status_id)
                 for each_target in target_list
             ]
+            for language_code, target_list in collection_targets.items()
+        }
 
         self._logger.info(f"Retrieved uncollected {collection_type} targets for {len(result)} languages")
         return result
@@ -70,7 +106,7 @@ class CollectionReportsService:
         """
         result = []
 
-        collector_name_id, _, collection_status_id = self._database_utils.get_name_type_status_ids(
+        collector_name_id, _, collection_status_id = self._get_name_type_status_ids(
             collector_name=collector_name,
             collection_status_name=collection_status_name,
         )
@@ -81,10 +117,11 @@ class CollectionReportsService:
             unique_languages_only=unique_languages_only,
         )
 
+        type_map = self._get_type_map()
+
         seen_types = set()
         for uncollected in uncollected_targets:
-            collection_type_obj = self._collection_types_dao.get_by_id(uncollected.collection_type_id)
-            name_type = collection_type_obj.collection_type if collection_type_obj else "unknown"
+            name_type = type_map.get(uncollected.collection_type_id, "unknown")
 
             if unique_languages_only:
                 if name_type not in seen_types:
@@ -94,9 +131,7 @@ class CollectionReportsService:
                 result.append(name_type)
 
         for uncollected in uncollected_targets:
-            collection_type_obj = self._collection_types_dao.get_by_id(uncollected.collection_type_id)
-            name_type = collection_type_obj.collection_type if collection_type_obj else "unknown"
-            result.append(name_type)
+            result.append(type_map.get(uncollected.collection_type_id, "unknown"))
 
         return result
 
@@ -115,7 +150,7 @@ class CollectionReportsService:
         """
         result = []
 
-        collector_name_id, _, collection_status_id = self._database_utils.get_name_type_status_ids(
+        collector_name_id, _, collection_status_id = self._get_name_type_status_ids(
             collector_name=collector_name,
             collection_status_name=collection_status,
         )
@@ -138,31 +173,19 @@ class CollectionReportsService:
     def get_collection_status_summary(self) -> Dict[str, Any]:
         """Gets summary of collection status across all types and languages"""
 
-        all_targets = self._collection_targets_dao.get_all()
-        all_statuses = self._collection_statuses_dao.get_all()
-        all_types = self._collection_types_dao.get_all()
-
-        status_map = {status.id: status.collection_status_name for status in all_statuses}
-        type_map = {type_obj.id: type_obj.collection_type for type_obj in all_types}
+        grouped_counts = self._collection_targets_dao.count_grouped_by_type_lang_status()
+        status_map = self._get_status_map()
+        type_map = self._get_type_map()
 
+        # Convert to expected format, totalling per status from the grouped counts
         by_type_language_status = []
-        status_counts = {}
-
-        # Group targets by type, language, and status
-        for target in all_targets:
-            type_name = type_map.get(target.collection_type_id, "unknown")
-            status_name = status_map.get(target.collection_status_id, "unknown")
-
-            key = (type_name, target.language_code, status_name)
-            if key not in status_counts:
-                status_counts[key] = 0
-            status_counts[key] += 1
-
-        # Convert to expected format
-        for (type_name, language_code, status_name), count in status_counts.items():
+        per_status: Counter = Counter()
+        for collection_type_id, language_code, collection_status_id, count in grouped_counts:
+            status_name = status_map.get(collection_status_id, "unknown")
+            per_status[status_name] += count
             by_type_language_status.append(
                 {
-                    "collection_type": type_name,
+                    "collection_type": type_map.get(collection_type_id, "unknown"),
                     "language_code": language_code,
                     "collection_status_name": status_name,
                     "count": count,
@@ -170,16 +193,10 @@ class CollectionReportsService:
             )
 
         # Calculate stats
-        from epochai.common.enums import CollectionStatusNames
-
-        total_targets = len(all_targets)
-        collected_count = sum(
-            1 for t in all_targets if status_map.get(t.collection_status_id) == CollectionStatusNames.COLLECTED.value
-        )
-        not_collected_count = sum(
-            1 for t in all_targets if status_map.get(t.collection_status_id) == CollectionStatusNames.NOT_COLLECTED.value
-        )
-        failed_count = sum(1 for t in all_targets if status_map.get(t.collection_status_id) == CollectionStatusNames.FAILED.value)
+        total_targets = sum(per_status.values())
+        collected_count = per_status[CollectionStatusNames.COLLECTED.value]
+        not_collected_count = per_status[CollectionStatusNames.NOT_COLLECTED.value]
+        failed_count = per_status[CollectionStatusNames.FAILED.value]
 
         summary = {
             "total_targets": total_targets,
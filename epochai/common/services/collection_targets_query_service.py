@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from epochai.common.database.dao.collection_statuses_dao import CollectionStatusesDAO
 from epochai.common.database.dao.collection_targets_dao import CollectionTargetsDAO
@@ -9,6 +11,17 @@ from epochai.common.utils.database_utils import DatabaseUtils
 from epochai.common.utils.decorators import handle_generic_errors_gracefully, handle_initialization_errors
 
 
+class TargetSearchResult(NamedTuple):
+    """Per-target projection returned by _unused_search_collection_targets"""
+
+    id: Optional[int]
+    name: str
+    type: str
+    language_code: str
+    collection_status: str
+    created_at: Optional[datetime]
+
+
 class CollectionTargetsQueryService:
     @handle_initialization_errors(f"{__name__} initialization")
     def __init__(self):
@@ -18,13 +31,15 @@ class CollectionTargetsQueryService:
         self._collection_statuses_dao = CollectionStatusesDAO()
         self._collection_types_dao = CollectionTypesDAO()
         self._database_utils = DatabaseUtils()
+        # name -> id lookups are repeated for the same collector / type / status names, failed lookups raise and aren't cached
+        self._get_name_type_status_ids = lru_cache(maxsize=256)(self._database_utils.get_name_type_status_ids)
         self._logger.debug("Database components initialized for CollectionTargetManager")
 
     @handle_generic_errors_gracefully("during Collection Target retrieval for", [])
     def _unused_search_collection_targets(
         self,
         search_term: str,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[TargetSearchResult]:
         """
         Search collection targets by their names
 
@@ -32,26 +47,20 @@ class CollectionTargetsQueryService:
         """
         collection_targets = self._collection_targets_dao.search_by_name(search_term)
 
-        result = []
-        for each_target in collection_targets:
-            collection_type_obj = self._collection_types_dao.get_by_id(each_target.collection_type_id)
-            type_name = collection_type_obj.collection_type if collection_type_obj else "unknown"
-
-            collection_status_obj = self._collection_statuses_dao.get_by_id(
-                each_target.collection_status_id,
-            )
-            status_name = collection_status_obj.collection_status_name if collection_status_obj else "unknown"
-
-            result.append(
-                {
-                    "id": each_target.id,
-                    "name": each_target.collection_name,
-                    "type": type_name,
-                    "language_code": each_target.language_code,
-                    "collection_status": status_name,
-                    "created_at": each_target.created_at,
-                },
+        type_map = {type_obj.id: type_obj.collection_type for type_obj in self._collection_types_dao.get_all()}
+        status_map = {status.id: status.collection_status_name for status in self._collection_statuses_dao.get_all()}
+
+        result = [
+            TargetSearchResult(
+                each_target.id,
+                each_target.collection_name,
+                type_map.get(each_target.collection_type_id, "unknown"),
+                each_target.language_code,
+                status_map.get(each_target.collection_status_id, "unknown"),
+                each_target.created_at,
             )
+            for each_target in collection_targets
+        ]
 
         self._logger.info(f"Found {len(result)} targets matching search term '{search_term}'")
         return result
@@ -78,7 +87,7 @@ class CollectionTargetsQueryService:
             Dict in format: {"collection_type": {"language_code": {"collection_name": target_id}}}
         """
 
-        collector_name_id, _, collection_status_id = self._database_utils.get_name_type_status_ids(
+        collector_name_id, _, collection_status_id = self._get_name_type_status_ids(
             collector_name=collector_name,
             collection_status_name=collection_status,
         )
@@ -92,25 +101,21 @@ class CollectionTargetsQueryService:
 
         # collector_name + collection_types + language_codes + collection_status
         elif collection_types and language_codes:
-            collection_targets = []
-            for collection_type in collection_types:
-                _, collection_type_id, _ = self._database_utils.get_name_type_status_ids(
-                    collection_type=collection_type,
-                )
+            collection_type_ids = [
+                self._get_name_type_status_ids(collection_type=collection_type)[1] for collection_type in collection_types
+            ]
 
-                for language_code in language_codes:
-                    type_lang_targets = self._collection_targets_dao.get_by_type_and_language(
-                        collection_type_id,
-                        language_code,
-                        collection_status_id,
-                    )
-                    collection_targets.extend(type_lang_targets)
+            collection_targets = self._collection_targets_dao.get_by_types_and_languages(
+                collection_type_ids,
+                language_codes,
+                collection_status_id,
+            )
 
         # collector_name + collection_types + collection_status
         elif collection_types and not language_codes:
             collection_targets = []
             for collection_type in collection_types:
-                _, collection_type_id, _ = self._database_utils.get_name_type_status_ids(
+                _, collection_type_id, _ = self._get_name_type_status_ids(
                     collection_type=collection_type,
                 )
 
@@ -122,11 +127,11 @@ class CollectionTargetsQueryService:
 
         # collector_name + language_codes + collection_status
         elif language_codes and not collection_types:
-            all_targets = self._collection_targets_dao.get_by_collector_name_id(
+            collection_targets = self._collection_targets_dao.get_by_collector_name_id_and_languages(
                 collector_name_id,
+                language_codes,
                 collection_status_id,
             )
-            collection_targets = [target for target in all_targets if target.language_code in language_codes]
 
         elif target_ids and language_codes:
             pass
@@ -138,12 +143,12 @@ class CollectionTargetsQueryService:
             self._logger.warning("Invalid parameter combination provided")
             return {}
 
-        # Group targets by type and language
+        # Group targets by type and language, resolving type names from one lookup rather than a query per target
+        type_map = {type_obj.id: type_obj.collection_type for type_obj in self._collection_types_dao.get_all()}
         grouped_targets: Dict[str, Any] = {}
 
         for target in collection_targets:
-            collection_type_obj = self._collection_types_dao.get_by_id(target.collection_type_id)
-            type_name = collection_type_obj.collection_type if collection_type_obj else "unknown"
+            type_name = type_map.get(target.collection_type_id, "unknown")
 
             if type_name not in grouped_targets:
                 grouped_targets[type_name] = {}
@@ -14,8 +14,7 @@ class RawDataService:
         self._validation_statuses_dao = ValidationStatusesDAO()
         self._logger.debug("RawDataService Initialized")
 
-    handle_generic_errors_gracefully("while creating raw data database object", None)
-
+    @handle_generic_errors_gracefully("while creating raw data database object", None)
     def create_raw_data(
         self,
         collection_attempt_id: int,
@@ -51,3 +50,37 @@ class RawDataService:
             self._logger.error(f"Error while creating raw data for attempt '{collection_attempt_id}' and title '{title}'")
 
         return result if result else None
+
+    @handle_generic_errors_gracefully("while creating raw data database object with its collection attempt", None)
+    def create_raw_data_with_attempt(
+        self,
+        collection_target_id: int,
+        attempt_status_name: str,
+        raw_data_metadata_schema_id: int,
+        item: Dict[str, Any],
+        language_code: str,
+        metadata: Dict[str, Any],
+        validation_status_name: str,
+        validation_error: Optional[Dict[str, Any]],
+        filepath_of_save: Optional[str],
+    ) -> Optional[int]:
+        """Creates the collection attempt and raw data for a collected item in one database round trip"""
+        title = item.get("title")
+
+        result = self._raw_data_dao.create_raw_data_with_attempt(
+            collection_target_id=collection_target_id,
+            attempt_status_name=attempt_status_name,
+            raw_data_metadata_schema_id=raw_data_metadata_schema_id,
+            title=title,
+            language_code=language_code,
+            validation_status_name=validation_status_name,
+            url=item.get("url"),
+            metadata=metadata,
+            validation_error=validation_error,
+            filepath_of_save=filepath_of_save,
+        )
+
+        if not result:
+            self._logger.error(f"Error while creating raw data and attempt for target '{collection_target_id}', title '{title}'")
+
+        return result if result else None
@@ -2,6 +2,9 @@ from epochai.common.database.dao.collection_statuses_dao import CollectionStatus
 from epochai.common.database.dao.collection_targets_dao import CollectionTargetsDAO
 from epochai.common.database.database import get_database
 from epochai.common.logging_config import get_logger
+from epochai.common.utils.database_utils import StatusIdCache
+
+_collection_status_ids = StatusIdCache(CollectionStatusesDAO, "collection_status_name")
 
 
 class TargetStatusManagementService:
@@ -10,7 +13,6 @@ class TargetStatusManagementService:
     def __init__(self):
         self._logger = get_logger(__name__)
         self._db_connection = get_database()
-        self._collection_statuses_dao = CollectionStatusesDAO()
         self._collection_targets_dao = CollectionTargetsDAO()
 
     def update_target_collection_status(
@@ -21,7 +23,7 @@ class TargetStatusManagementService:
         """Updates a collection status to the passed in value"""
 
         try:
-            collection_status_id = self._collection_statuses_dao.get_id_by_name(collection_status_name)
+            collection_status_id = _collection_status_ids.get_id(collection_status_name)
             if not collection_status_id:
                 self._logger.error(f"Status ID for '{collection_status_name}' not found for target ID '{collection_target_id}'")
                 return False
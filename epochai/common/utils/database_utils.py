@@ -1,4 +1,4 @@
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from epochai.common.database.dao.collection_statuses_dao import CollectionStatusesDAO
 from epochai.common.database.dao.collection_types_dao import CollectionTypesDAO
@@ -40,3 +40,44 @@ class DatabaseUtils:
                 raise ValueError(f"Collection status '{collection_status_name}' not found")
 
         return collector_name_id, collection_type_id, collection_status_id
+
+
+class StatusIdCache:
+    """
+    Process-wide status name -> id map for a seeded status lookup table, shared by every instance of a service
+
+    Note: an empty load is not kept, and a name that is not found drops the map so statuses added since it was
+    loaded are picked up on the next call
+    """
+
+    def __init__(
+        self,
+        dao_class: Callable[[], Any],
+        name_field: str,
+    ):
+        self._dao_class = dao_class
+        self._name_field = name_field
+        self._ids: Optional[Dict[str, int]] = None
+
+    def get_ids(self) -> Dict[str, int]:
+        """Gets the status name -> id map, loading it from the database on first use"""
+        if self._ids is None:
+            ids = {getattr(status, self._name_field): status.id for status in self._dao_class().get_all() if status.id}
+            if not ids:
+                return ids
+            self._ids = ids
+        return self._ids
+
+    def get_id(
+        self,
+        status_name: str,
+    ) -> Optional[int]:
+        """Gets the id of a status, or None if it does not exist"""
+        status_id = self.get_ids().get(status_name)
+        if status_id is None:
+            self.clear()
+        return status_id
+
+    def clear(self) -> None:
+        """Drops the loaded map so the next call reads the table again"""
+        self._ids = None
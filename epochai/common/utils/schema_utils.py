@@ -1,7 +1,12 @@
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import fastjsonschema
+from fastjsonschema import JsonSchemaValueException
 import jsonschema
-from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
 
 from epochai.common.config.config_loader import ConfigLoader
 from epochai.common.logging_config import get_logger
@@ -9,6 +14,19 @@ from epochai.common.protocols.metadata_schema_dao_protocol import MetadataSchema
 from epochai.common.utils.decorators import handle_generic_errors_gracefully, handle_initialization_errors
 
 
+@lru_cache(maxsize=32)
+def _compile_schema_validator(schema_json: str) -> Callable[[Dict[str, Any]], Any]:
+    """Compiles a validator for a canonical (sorted keys) schema JSON string, shared by every SchemaUtils using that schema"""
+    # Matches Draft7Validator, which neither fills in schema defaults on the data nor checks "format"
+    return fastjsonschema.compile(json.loads(schema_json), use_default=False, use_formats=False)
+
+
+@lru_cache(maxsize=32)
+def _detail_schema_validator(schema_json: str) -> jsonschema.Draft7Validator:
+    """Builds the Draft7Validator used to describe a failure, fastjsonschema stops at the first error without sub errors"""
+    return jsonschema.Draft7Validator(json.loads(schema_json))
+
+
 class SchemaUtils:
     @handle_initialization_errors(f"{__name__} initialization")
     def __init__(
@@ -33,8 +51,10 @@ class SchemaUtils:
 
         # SCHEMA MANAGEMENT
         self._metadata_schema_cache: Optional[Dict[str, Any]] = None
-        self._schema_validator: Optional[jsonschema.protocols.Validator] = None
+        self._schema_validator: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self._schema_json: Optional[str] = None
         self._metadata_schema_id: Optional[int] = None
+        self._metadata_schema_updated_at: Optional[datetime] = None
         self._temp_schemas: List[Dict[str, Any]] = []
 
         # SCHEMA MANAGEMENT CHECKS
@@ -49,35 +69,34 @@ class SchemaUtils:
     @handle_generic_errors_gracefully("while loading schema from database", None)
     def _load_schema_from_database(self) -> None:
         """Load current metadata schema from the the database"""
-        all_schemas = self._dao.get_all()
+        schema = self._dao.get_by_name_and_version(
+            self._schema_name_field,
+            self._name,
+            self._schema_version_field,
+            self._version,
+        )
+        if schema is None:
+            raise ValueError(f"No schema found for {self._name} v{self._version}")
 
-        for each_schema in all_schemas:
-            schema_content = each_schema.metadata_schema
-            if (
-                isinstance(schema_content, dict)
-                and schema_content.get(self._schema_name_field) == self._name
-                and schema_content.get(self._schema_version_field) == self._version
-            ):
-                self._metadata_schema_cache = schema_content
-                self._metadata_schema_id = each_schema.id
+        self._metadata_schema_cache = schema.metadata_schema
+        self._metadata_schema_id = schema.id
+        self._metadata_schema_updated_at = schema.updated_at
 
-                self._create_validator_using_schema(schema_content)
+        self._create_validator_using_schema(schema.metadata_schema)
 
-                self._logger.info(f"Using Schema with ID '{self._metadata_schema_id} from Database'")
-                return
-
-        raise ValueError(f"No schema found for {self._name} v{self._version}")
+        self._logger.info(f"Using Schema with ID '{self._metadata_schema_id} from Database'")
 
     @handle_generic_errors_gracefully("during schema validator creation", None)
     def _create_validator_using_schema(
         self,
         schema_content: Dict[str, Any],
     ) -> None:
-        """Creates JSON schema validator using database schema"""
+        """Creates JSON schema validator using database schema, compiled once into a function specialised to it"""
         only_schema = schema_content.get("schema")
         if not only_schema:
             raise ValueError("Schema content missing 'schema' section")
-        self._schema_validator = jsonschema.Draft7Validator(only_schema)
+        self._schema_json = json.dumps(only_schema, sort_keys=True)
+        self._schema_validator = _compile_schema_validator(self._schema_json)
 
     def _validate_with_json_schema(
         self,
@@ -85,25 +104,32 @@ class SchemaUtils:
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Validates using JSON schema"""
         try:
-            self._schema_validator.validate(data)
+            self._schema_validator(data)
             return True, None
 
-        except ValidationError as validation_error:
-            validation_errors: List[str] = []
+        except JsonSchemaValueException as fast_validation_error:
+            # Failures are the rare path, so the full Draft7 error (field path and anyOf/oneOf sub errors) is
+            # rebuilt here, keeping the recorded validation_error identical to a plain jsonschema validation
+            validation_error = best_match(_detail_schema_validator(self._schema_json).iter_errors(data))
+            if validation_error is None:
+                # The two validators disagree, the record still fails with the fastjsonschema error
+                return False, {
+                    "validation_errors": [f"Schema validation failed: {fast_validation_error.message}"],
+                    "schema_validation_error": str(fast_validation_error),
+                    "failed_value": fast_validation_error.value,
+                }
 
-            validation_errors.append(f"Schema validation failed: {validation_error.message}")
+            validation_errors = [f"Schema validation failed: {validation_error.message}"]
 
             if validation_error.absolute_path:
-                field_path = ".".join(str(p) for p in validation_error.absolute_path)
-                validation_errors.append(f"Field path: {field_path}")
+                validation_errors.append(f"Field path: {'.'.join(map(str, validation_error.absolute_path))}")
 
-            for sub_error in validation_error.context:
-                validation_errors.append(f"Sub error: {sub_error.message}")
+            validation_errors.extend(f"Sub error: {sub_error.message}" for sub_error in validation_error.context)
 
             error_dict = {
                 "validation_errors": validation_errors,
                 "schema_validation_error": str(validation_error),
-                "failed_value": validation_error.instance if hasattr(validation_error, "instance") else None,
+                "failed_value": validation_error.instance,
             }
 
             return False, error_dict
@@ -138,9 +164,21 @@ class SchemaUtils:
         """Reload schema from database (call this when it changes externally)"""
         try:
             old_schema_id = self._metadata_schema_id
+
+            # Cheap id / updated_at probe first so an unchanged schema is not refetched and recompiled
+            latest = self._dao.get_id_and_updated_at_by_name_and_version(
+                self._schema_name_field,
+                self._name,
+                self._schema_version_field,
+                self._version,
+            )
+            if self._schema_validator is not None and latest == (old_schema_id, self._metadata_schema_updated_at):
+                return False
+
             self._metadata_schema_cache = None
             self._schema_validator = None
             self._metadata_schema_id = None
+            self._metadata_schema_updated_at = None
 
             self._load_schema_from_database()
 
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from epochai.common.config.config_loader import ConfigLoader
 from epochai.common.database.dao.check_collection_targets_dao import CheckCollectionTargetsDAO
-from epochai.common.enums import CollectionStatusNames
+from epochai.common.enums import CollectionStatusNames, TestStatusNames
 from epochai.common.logging_config import get_logger
 from epochai.common.services.target_status_management_service import TargetStatusManagementService
 from epochai.common.utils.decorators import handle_generic_errors_gracefully, handle_initialization_errors
@@ -56,6 +56,11 @@ class Checker:
             self._logger.warning("No target config provided for checking")
             return []
 
+        # Membership is tested per language / per target below
+        type_filter = frozenset(collection_types) if collection_types else None
+        language_filter = frozenset(language_codes) if language_codes else None
+        target_id_filter = frozenset(target_ids) if target_ids else None
+
         check_results = []
         total_targets = 0
         successful_checks = 0
@@ -66,21 +71,21 @@ class Checker:
                 continue
 
             # Filter by collection types if specified
-            if collection_types and collection_type not in collection_types:
+            if type_filter and collection_type not in type_filter:
                 continue
 
             self._logger.info(f"Checking collection type: {collection_type}")
 
             for language_code, items_dict in language_data.items():
                 # Filter by language codes if specified
-                if language_codes and language_code not in language_codes:
+                if language_filter and language_code not in language_filter:
                     continue
 
                 self._logger.info(f"Checking language: {language_code} for type: {collection_type}")
 
                 for collection_name, collection_target_id in items_dict.items():
                     # Filter by target IDs if specified
-                    if target_ids and collection_target_id not in target_ids:
+                    if target_id_filter and collection_target_id not in target_id_filter:
                         continue
 
                     total_targets += 1
@@ -99,7 +104,7 @@ class Checker:
                     if check_result:
                         check_results.append(check_result)
 
-                        if check_result.get("test_status") == "success":
+                        if check_result.get("test_status") == TestStatusNames.SUCCESS.value:
                             successful_checks += 1
                         else:
                             failed_checks += 1
@@ -134,7 +139,7 @@ class Checker:
         self._logger.info(f"Checking ({language_code}): '{collection_name}'")
 
         start_time = time.time()
-        test_status = "failed"
+        test_status = TestStatusNames.FAILED.value
         search_results_found = []
         error_message = ""
 
@@ -149,7 +154,7 @@ class Checker:
                 error_message = "No suitable check method found for collector type"
 
             if result:
-                test_status = "success"
+                test_status = TestStatusNames.SUCCESS.value
                 # Extract title/name from result if available
                 if isinstance(result, dict):
                     found_title = result.get("title", collection_name)
@@ -166,21 +171,21 @@ class Checker:
                 if hasattr(self._utils, "search_using_config"):
                     search_results = self._utils.search_using_config(collection_name, language_code)
                     if search_results:
-                        test_status = "failed_with_suggestions"
+                        test_status = TestStatusNames.FAILED_WITH_SUGGESTIONS.value
                         search_results_found = search_results[:5]
                         error_message = f"Target not found, but {len(search_results)} search suggestions available"
                         self._logger.warning(f"Target not found but search suggestions available: '{collection_name}'")
                     else:
-                        test_status = "failed"
+                        test_status = TestStatusNames.FAILED.value
                         error_message = "Target not found and no search suggestions available"
                         self._logger.warning(f"Target not found: '{collection_name}'")
                 else:
-                    test_status = "failed"
+                    test_status = TestStatusNames.FAILED.value
                     error_message = "Target not accessible"
                     self._logger.warning(f"Target check failed: '{collection_name}'")
 
         except Exception as e:
-            test_status = "failed"
+            test_status = TestStatusNames.FAILED.value
             error_message = f"Error during check: {e!s}"
             self._logger.error(f"Error checking '{collection_name}': {e}")
 
@@ -7,7 +7,7 @@ import sys
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from epochai.common.config.config_loader import ConfigLoader
-from epochai.common.enums import CollectionStatusNames
+from epochai.common.enums import CollectionStatusNames, TestStatusNames
 from epochai.common.logging_config import get_logger, setup_logging
 from epochai.common.services.collection_reports_service import CollectionReportsService
 from epochai.common.services.collection_targets_query_service import CollectionTargetsQueryService
@@ -624,7 +624,7 @@ def main():
                         failed = len(result) - successful
 
                         if command == "check":
-                            successful = sum(1 for item in result if item.get("test_status") == "success")
+                            successful = sum(1 for item in result if item.get("test_status") == TestStatusNames.SUCCESS.value)
                             failed = len(result) - successful
                         else:
                             successful = sum(1 for item in result if item.get("success", True))
@@ -4,7 +4,6 @@ from typing import Any, Dict, List, Optional, Tuple
 from epochai.common.config.config_loader import ConfigLoader
 from epochai.common.enums import AttemptStatusNames, CollectionStatusNames, ValidationStatusNames
 from epochai.common.logging_config import get_logger
-from epochai.common.services.collection_attempts_service import CollectionAttemptsService
 from epochai.common.services.raw_data_service import RawDataService
 from epochai.common.services.target_status_management_service import TargetStatusManagementService
 from epochai.common.utils.data_utils import DataUtils
@@ -31,7 +30,6 @@ class BaseSaver(ABC):
         if self._save_to_database:
             # SERVICES
             self._target_status_management_service = TargetStatusManagementService()
-            self._collection_attempts_service = CollectionAttemptsService()
             self._raw_data_service = RawDataService()
 
             # ASSIGN PARAMS TO INSTANCE VARS
@@ -84,22 +82,23 @@ class BaseSaver(ABC):
     @handle_generic_errors_gracefully("while creating raw data record", None)
     def _create_raw_data_record(
         self,
-        attempt_id: int,
+        collection_target_id: int,
         item: Dict[str, Any],
         language_code: str,
         metadata: Dict[str, Any],
         validation_status_name: str,
         validation_error: Optional[Dict[str, Any]],
     ) -> Optional[int]:
-        """Create a raw data record in the database"""
+        """Create the collection attempt and raw data record for an item in the database"""
 
         schema_id = self._schema_utils.get_metadata_schema_id()
         if not schema_id:
             self._logger.error(f"No schema ID available for '{item.get('title', 'unknown')}', skipping...")
             return None
 
-        content_id = self._raw_data_service.create_raw_data(
-            collection_attempt_id=attempt_id,
+        content_id = self._raw_data_service.create_raw_data_with_attempt(
+            collection_target_id=collection_target_id,
+            attempt_status_name=AttemptStatusNames.SUCCESS.value,
             raw_data_metadata_schema_id=schema_id,
             item=item,
             language_code=language_code,
@@ -137,17 +136,6 @@ class BaseSaver(ABC):
             self._logger.error(f"Skipping due to missing title or content in item: {item}")
             return None
 
-        attempt_id = self._collection_attempts_service.create_collection_attempt(
-            item=item,
-            collection_target_id=collection_target_id,
-            language_code=language_code,
-            new_status_name=AttemptStatusNames.SUCCESS.value,
-        )
-
-        if not attempt_id:
-            self._logger.error(f"Failed to create attempt for '{title}' - Not saving metadata for this")
-            return None
-
         metadata = self._prepare_metadata_for_storage(collected_item=item, language_code=language_code)
 
         if self._validate_before_save:
@@ -156,7 +144,7 @@ class BaseSaver(ABC):
             validation_status_name, validation_error = ValidationStatusNames.PENDING.value, None
 
         content_id = self._create_raw_data_record(
-            attempt_id=attempt_id,
+            collection_target_id=collection_target_id,
             item=item,
             language_code=language_code,
             metadata=metadata,
@@ -165,7 +153,7 @@ class BaseSaver(ABC):
         )
 
         if content_id:
-            self._logger.info(f"Successfully saved '{title}' to database with status '{validation_status_name}'")
+            self._logger.info("Successfully saved '%s' to database with status '%s'", title, validation_status_name)
             return content_id
 
         self._logger.error(f"Failed to save '{title}' to database")
@@ -13,7 +13,7 @@ class FiveThirtyEightSaver(BaseSaver):
     ):
         super().__init__(collector_name, collector_version)
 
-        self._required_fields = ["cycle", "state", "candidate_name", "pct_estimate"]
+        self._required_fields = ("cycle", "state", "candidate_name", "pct_estimate")
         self._min_pct_estimate = 0.0
         self._max_pct_estimate = 100.0
         self._valid_cycles = list(range(1968, 2025))
@@ -89,13 +89,11 @@ class FiveThirtyEightSaver(BaseSaver):
         data: Dict[str, Any],
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Custom validation function for collected FiveThirtyEight polling data"""
-        validation_errors = []
-
-        for field in self._required_fields:
-            if field not in data:
-                validation_errors.append(f"Missing required field: {field}")
-            elif data[field] is None:
-                validation_errors.append(f"Required field is null: {field}")
+        validation_errors = [
+            f"Missing required field: {field}" if field not in data else f"Required field is null: {field}"
+            for field in self._required_fields
+            if field not in data or data[field] is None
+        ]
 
         if "cycle" in data and data["cycle"] is not None:
             try:
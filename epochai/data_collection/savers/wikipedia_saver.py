@@ -14,7 +14,7 @@ class WikipediaSaver(BaseSaver):
         super().__init__(collector_name, collector_version)
 
         self._min_content_length = self._data_config.get("data_validator").get("min_content_length")
-        self._required_fields = self._data_config.get("data_validator").get("required_fields_wikipedia")
+        self._required_fields = tuple(self._data_config.get("data_validator").get("required_fields_wikipedia"))
 
     @handle_generic_errors_gracefully("while preparing metadata for storage", {})
     def _prepare_metadata_for_storage(
@@ -52,13 +52,11 @@ class WikipediaSaver(BaseSaver):
         data: Dict[str, Any],
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Custom validation function for collected Wikipedia data"""
-        validation_errors = []
-
-        for field in self._required_fields:
-            if field not in data:
-                validation_errors.append(f"Missing required field: {field}")
-            elif not data[field]:
-                validation_errors.append(f"Empty required field: {field}")
+        validation_errors = [
+            f"Missing required field: {field}" if field not in data else f"Empty required field: {field}"
+            for field in self._required_fields
+            if field not in data or not data[field]
+        ]
 
         if "content" in data:
             content = data["content"]
@@ -66,7 +66,7 @@ class BaseCleaner(ABC):
                 self.logger.error(f"Raw data with id '{raw_data_id}' not found")
                 return None
 
-            self.logger.info(f"Cleaning raw data id '{raw_data_id}': '{raw_data.title}'")
+            self.logger.info("Cleaning raw data id '%s': '%s'", raw_data_id, raw_data.title)
 
             existing_cleaned: List[CleanedData] = self.service.cleaned_data_dao.get_by_raw_data_id(
                 raw_data_id,
@@ -100,7 +100,6 @@ class BaseCleaner(ABC):
             cleaning_time_ms = int((time.time() - start_time) * 1000)
             self.logger.error(f"Error cleaning raw data {raw_data_id}: {general_error}")
 
-            schema_id = self._schema_utils.get_metadata_schema_id()
             if "raw_data" in locals() and raw_data:
                 schema_id = self._schema_utils.get_metadata_schema_id()
                 self.service.save_error_record(raw_data, general_error, cleaning_time_ms, schema_id)
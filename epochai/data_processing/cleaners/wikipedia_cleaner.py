@@ -51,7 +51,7 @@ class WikipediaCleaner(BaseCleaner):
 
     def _clean_categories(self, categories: List) -> List:
         """Cleans and deduplicates categories"""
-        if not categories or not isinstance(categories, List):
+        if not categories or not isinstance(categories, list):
             return []
 
         cleaned_categories = []
@@ -72,7 +72,7 @@ class WikipediaCleaner(BaseCleaner):
     def _clean_links(self, links: List) -> List:
         """Cleans and deduplicates internal links"""
 
-        if not links or not isinstance(links, List):
+        if not links or not isinstance(links, list):
             return []
 
         cleaned_links = []
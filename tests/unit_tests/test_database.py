@@ -61,12 +61,21 @@ class TestDatabaseConnectionInitialization:
             db_conn = DatabaseConnection()
 
             assert db_conn._connection_parameters["host"] == "localhost"
-            assert db_conn._connection_parameters["port"] == "5432"
+            assert db_conn._connection_parameters["port"] == 5432
             assert db_conn._connection_parameters["database"] == "test_db"
             assert db_conn._connection_parameters["user"] == "test_user"
             assert db_conn._connection_parameters["password"] == "test_password"
             assert db_conn._connection is None
 
+    def test_initialization_optional_connection_options(self, mock_env_vars):
+        env = {**mock_env_vars, "DB_SSLMODE": "disable", "DB_APPLICATION_NAME": "epochai_tests"}
+        with patch.dict(os.environ, env):
+            db_conn = DatabaseConnection()
+
+            assert db_conn._connection_options["sslmode"] == "disable"
+            assert db_conn._connection_options["application_name"] == "epochai_tests"
+            assert db_conn._connection_options["keepalives"] == 1
+
     def test_initialization_missing_env_vars(self):
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValueError) as exc_info:
@@ -76,6 +85,13 @@ class TestDatabaseConnectionInitialization:
             assert "host" in str(exc_info.value)
             assert "port" in str(exc_info.value)
 
+    def test_initialization_non_integer_port(self, mock_env_vars):
+        with patch.dict(os.environ, {**mock_env_vars, "DB_PORT": "not_a_port"}):
+            with pytest.raises(ValueError) as exc_info:
+                DatabaseConnection()
+
+            assert "DB_PORT must be an integer" in str(exc_info.value)
+
     def test_initialization_partial_missing_env_vars(self):
         partial_env = {"DB_HOST": "localhost", "DB_PORT": "5432"}
         with patch.dict(os.environ, partial_env, clear=True):
@@ -99,10 +115,16 @@ class TestConnectToDatabase:
         assert db_connection._connection == mock_psycopg2_connection
         mock_connect.assert_called_once_with(
             host="localhost",
-            port="5432",
+            port=5432,
             database="test_db",
             user="test_user",
             password="test_password",
+            sslmode="prefer",
+            application_name="epochai",
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
             cursor_factory=RealDictCursor,
         )
         assert db_connection._connection.autocommit is False
@@ -277,6 +299,90 @@ class TestExecuteSelectQuery:
             mock_cursor.execute.assert_called_once_with("SELECT * FROM test", None)
 
 
+class TestExecuteSelectQueryTuples:
+    def test_uses_tuple_cursor(self, db_connection, mock_cursor):
+        mock_cursor.fetchall.return_value = [(1, "test")]
+
+        with patch.object(db_connection, "get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+            mock_get_cursor.return_value.__exit__.return_value = None
+
+            results = db_connection.execute_select_query_tuples("SELECT id, name FROM test")
+
+            assert results == [(1, "test")]
+            mock_get_cursor.assert_called_once_with(cursor_factory=psycopg2.extensions.cursor)
+            mock_cursor.execute.assert_called_once_with("SELECT id, name FROM test", None)
+
+
+class TestIterSelectQuery:
+    def test_streams_rows_from_named_cursor(self, db_connection, mock_cursor):
+        mock_cursor.__iter__ = Mock(return_value=iter([{"id": 1}, {"id": 2}]))
+
+        with patch.object(db_connection, "get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+            mock_get_cursor.return_value.__exit__.return_value = None
+
+            rows = list(db_connection.iter_select_query("SELECT * FROM test", itersize=50))
+
+            assert rows == [{"id": 1}, {"id": 2}]
+            assert mock_get_cursor.call_args.kwargs["name"].startswith("stream_")
+            assert mock_get_cursor.call_args.kwargs["withhold"] is True
+            assert mock_cursor.itersize == 50
+            mock_cursor.execute.assert_called_once_with("SELECT * FROM test", None)
+
+
+class TestExecutePreparedSelectQuery:
+    def test_prepares_once_then_executes(self, db_connection, mock_cursor):
+        mock_cursor.fetchall.return_value = [{"id": 1}]
+        db_connection.prepare_statement("test_by_name", "SELECT * FROM test WHERE name = $1")
+
+        with patch.object(db_connection, "get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+            mock_get_cursor.return_value.__exit__.return_value = None
+
+            db_connection.execute_prepared_select_query("test_by_name", ("a",))
+            results = db_connection.execute_prepared_select_query("test_by_name", ("b",))
+
+        assert results == [{"id": 1}]
+        assert mock_cursor.execute.call_args_list[0].args == ("PREPARE test_by_name AS SELECT * FROM test WHERE name = $1",)
+        assert mock_cursor.execute.call_args_list[1].args == ("EXECUTE test_by_name (%s)", ("a",))
+        assert mock_cursor.execute.call_args_list[2].args == ("EXECUTE test_by_name (%s)", ("b",))
+        assert mock_cursor.execute.call_count == 3
+
+    def test_reprepares_after_reconnect(self, db_connection, mock_cursor, mock_psycopg2_connection):
+        db_connection.prepare_statement("test_by_id", "SELECT * FROM test WHERE id = $1")
+        db_connection._prepared_on_connection.add("test_by_id")
+
+        with patch("epochai.common.database.database.psycopg2.connect", return_value=mock_psycopg2_connection):
+            db_connection.connect_to_database()
+
+        assert "test_by_id" not in db_connection._prepared_on_connection
+
+    def test_unregistered_statement_raises(self, db_connection):
+        with pytest.raises(ValueError) as exc_info:
+            db_connection.execute_prepared_select_query("missing", (1,))
+
+        assert "No prepared statement registered" in str(exc_info.value)
+
+
+class TestExecutePreparedInsertQuery:
+    def test_returns_inserted_id_and_commits(self, db_connection, mock_cursor, mock_psycopg2_connection):
+        db_connection._connection = mock_psycopg2_connection
+        mock_cursor.description = [("id",)]
+        mock_cursor.fetchone.return_value = {"id": 42}
+        db_connection.prepare_statement("test_insert", "INSERT INTO test (name) VALUES ($1) RETURNING id")
+
+        with patch.object(db_connection, "get_cursor") as mock_get_cursor:
+            mock_get_cursor.return_value.__enter__.return_value = mock_cursor
+            mock_get_cursor.return_value.__exit__.return_value = None
+
+            result = db_connection.execute_prepared_insert_query("test_insert", ("a",))
+
+        assert result == 42
+        assert mock_cursor.execute.call_args_list[1].args == ("EXECUTE test_insert (%s)", ("a",))
+        mock_psycopg2_connection.commit.assert_called_once()
+
+
 class TestExecuteInsertQuery:
     def test_execute_insert_query_with_id_return(self, db_connection, mock_cursor, mock_psycopg2_connection):
         db_connection._connection = mock_psycopg2_connection